@@ -1,9 +1,13 @@
 import asyncio
+import sys
 from agents import Agent, Runner
 from openai.types.responses import ResponseTextDeltaEvent
 from agents.mcp import MCPServerStdio
 from config import REDIS_CONFIG, MCP_CONFIG, OPENAI_CONFIG, get_mcp_path
 
+SENTENCE_END = (".", "!", "?", "\n")
+EXIT_COMMANDS = frozenset({"exit", "quit"})
+
 
 async def main():
     # connect to the MCP server
@@ -27,8 +31,10 @@ async def main():
     print("Redis MCP Demo\n")
     
     while True:     # chatbot loop
-        user_input = input("You: ")
-        if user_input.lower() in ["exit", "quit"]:
+        user_input = input("You: ").strip()
+        if not user_input:
+            continue
+        if user_input.lower() in EXIT_COMMANDS:
             break
             
         # runner for orchestrating the agent
@@ -38,8 +44,12 @@ async def main():
         print("AI: ", end="")
         async for event in result.stream_events():
             if event.type == "raw_response_event" and isinstance(event.data, ResponseTextDeltaEvent):
-                print(event.data.delta, end="", flush=True)
-        print("\n")
+                delta = event.data.delta
+                sys.stdout.write(delta)
+                # flush on sentence boundaries instead of every token
+                if delta.endswith(SENTENCE_END):
+                    sys.stdout.flush()
+        print("\n", flush=True)
 
 
 if __name__ == "__main__":
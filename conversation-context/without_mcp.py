@@ -1,73 +1,155 @@
-import redis
+import asyncio
 import json
+import socket
+import redis.asyncio as redis
 import openai
+from collections import deque
 from datetime import datetime
 from config import REDIS_CONFIG, OPENAI_CONFIG
 
-redis_client = redis.Redis(
-    host=REDIS_CONFIG['REDIS_HOST'],
-    port=int(REDIS_CONFIG['REDIS_PORT']),
-    password=REDIS_CONFIG['REDIS_PWD'],
-    decode_responses=True
-)
+# small shared pool; a local unix socket skips the TCP stack entirely
+if REDIS_CONFIG.get('REDIS_SOCKET'):
+    redis_pool = redis.ConnectionPool(
+        connection_class=redis.UnixDomainSocketConnection,
+        path=REDIS_CONFIG['REDIS_SOCKET'],
+        password=REDIS_CONFIG['REDIS_PWD'],
+        max_connections=4
+    )
+else:
+    redis_pool = redis.ConnectionPool(
+        host=REDIS_CONFIG['REDIS_HOST'],
+        port=int(REDIS_CONFIG['REDIS_PORT']),
+        password=REDIS_CONFIG['REDIS_PWD'],
+        max_connections=4,
+        socket_keepalive=True,
+        socket_keepalive_options={socket.TCP_KEEPIDLE: 60} if hasattr(socket, 'TCP_KEEPIDLE') else {},
+        health_check_interval=30
+    )
+
+redis_client = redis.Redis(connection_pool=redis_pool)
+
+client = openai.AsyncOpenAI()
+
+# last 20 rendered messages for LLM context; Redis stays the source of truth
+HISTORY_SIZE = 20
+history_cache = deque(maxlen=HISTORY_SIZE)
+
+EXIT_COMMANDS = frozenset({"exit", "quit"})
+
+SYSTEM_MESSAGE = {
+    "role": "system",
+    "content": "You are a helpful assistant. Use the conversation history for context."
+}
+
+# server-side append: every queued message goes in with a single EVALSHA,
+# trimming old entries (MAXLEN ~) so the stream stays bounded
+APPEND_MESSAGES_SCRIPT = """
+for i = 1, #ARGV, 3 do
+    redis.call('XADD', KEYS[1], 'MAXLEN', '~', 1000, '*',
+               'role', ARGV[i], 'content', ARGV[i + 1], 'timestamp', ARGV[i + 2])
+end
+return #ARGV / 3
+"""
+append_messages = redis_client.register_script(APPEND_MESSAGES_SCRIPT)
+
+# (role, content, timestamp) triples waiting for the next flush
+pending_messages = []
 
-client = openai.OpenAI()
+# the function to queue a message for the Redis stream
+def store_message(role, content, timestamp):
+    # fields are stored natively on the stream entry, no JSON blob
+    pending_messages.extend((role, content, timestamp))
+    history_cache.append(f"{role}: {content}")
 
-# the function to store messages in Redis stream
-def store_message(role, content):
-    message_data = {
-        'role': role,
-        'content': content,
-        'timestamp': datetime.now().isoformat()
-    }
-    # Add message to Redis stream
-    redis_client.xadd('chat:history', {'data': json.dumps(message_data)})
 
+# function to write all queued messages to the Redis stream
+async def flush_messages():
+    batch = pending_messages.copy()
+    await append_messages(keys=['chat:history'], args=batch)
+    # dequeue only once written; a failed write leaves the batch for the next flush
+    del pending_messages[:len(batch)]
 
-# function to retrieve conversation history from Redis
+
+# function to seed the local history cache from Redis on startup
+async def load_conversation_history():
+    messages = await redis_client.xrevrange('chat:history', '+', '-', count=HISTORY_SIZE)
+
+    # entries arrive newest first from XREVRANGE, as raw bytes
+    for msg_id, data in reversed(messages):
+        if b'role' in data and b'content' in data:
+            history_cache.append((data[b'role'] + b": " + data[b'content']).decode('utf-8'))
+        elif b'data' in data:
+            # older entries hold the whole message as one JSON blob
+            try:
+                message = json.loads(data[b'data'])
+                history_cache.append(f"{message['role']}: {message['content']}")
+            except (ValueError, KeyError, TypeError):
+                continue
+        # anything else on the stream is not a chat message; skip it
+
+
+# function to retrieve conversation history for LLM context
 def get_conversation_history():
-    messages = redis_client.xrange('chat:history', '-', '+')
-    history = []
-    
-    for msg_id, data in messages:
-        message = json.loads(data['data'])
-        history.append(f"{message['role']}: {message['content']}")
-    # Return the last 20 messages for LLM context, from redis stream
-    return "\n".join(history[-20:])  
+    return "\n".join(history_cache)
 
 ### function to send user input to OpenAI and get a response
-def chat_with_ai(user_input, history):
+async def chat_with_ai(user_input, history):
+    # first turn: no history block to send
+    if history:
+        content = f"Conversation history:\n{history}\n\nUser: {user_input}"
+    else:
+        content = user_input
     messages = [
-        {"role": "system",
-          "content": "You are a helpful assistant. Use the conversation history for context."},
-        {"role": "user", 
-         "content": f"Conversation history:\n{history}\n\nUser: {user_input}"}
+        SYSTEM_MESSAGE,
+        {"role": "user", "content": content}
     ]
     
-    response = client.chat.completions.create(
+    response = await client.chat.completions.create(
         model=OPENAI_CONFIG["model"],
         messages=messages
     )
     return response.choices[0].message.content
 
-def main():
+async def main():
     print(" Non-MCP Redis Demo.")
-    
-    while True:
-        user_input = input("You: ")
-        if user_input.lower() in ["exit", "quit"]:
-            break
 
-        store_message("user", user_input)
+    await load_conversation_history()
+
+    write = None
+    try:
+        while True:
+            user_input = input("You: ").strip()
+            if not user_input:
+                continue
+            if user_input.lower() in EXIT_COMMANDS:
+                break
+
+            # prior turns only; the new message is sent separately below
+            history = get_conversation_history()
 
-        history = get_conversation_history()
+            store_message("user", user_input, datetime.now().isoformat())
+            # write to Redis while the OpenAI request is in flight; the previous
+            # assistant message and the new user message share one round trip
+            write = asyncio.create_task(flush_messages())
 
-        ai_response = chat_with_ai(user_input, history)
+            ai_response = await chat_with_ai(user_input, history)
+            await write
 
-        store_message("assistant", ai_response)
+            # stamped when the reply arrives; sent with the next turn's write
+            store_message("assistant", ai_response, datetime.now().isoformat())
 
-        print(f"AI: {ai_response}\n")
+            print(f"AI: {ai_response}\n")
+    finally:
+        # let an in-flight write finish first, so its batch is not sent twice
+        if write is not None:
+            try:
+                await write
+            except Exception:
+                pass  # a failed batch stays pending and is retried below
+        # flush the last assistant message, also on Ctrl-C
+        if pending_messages:
+            await flush_messages()
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    asyncio.run(main())
\ No newline at end of file
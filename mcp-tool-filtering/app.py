@@ -1,24 +1,30 @@
 import time
 import asyncio
-import json
+import gzip
 import os
+import re
+import threading
+from collections import OrderedDict
 from typing import Optional, Dict, Any, List
 from datetime import datetime
 import logging
 
 import uvicorn
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, ORJSONResponse, Response
 from fastapi.staticfiles import StaticFiles
 from pydantic import BaseModel
 import redis.asyncio as redis
+from redis.commands.search.query import Query
 from redisvl.index import SearchIndex
 from redisvl.query import VectorQuery
 import openai
+import httpx
 import tiktoken
 import numpy as np
-import struct
+import orjson
+import xxhash
 import os
 
 # Configure environment for optimal performance
@@ -34,28 +40,58 @@ logging.basicConfig(level=log_level)
 logger = logging.getLogger(__name__)
 enable_timing_logs = PERFORMANCE_CONFIG.get("enable_timing_logs", True)
 
+# Vector storage precision shared by both indexes, embedding writes and queries
+vector_datatype = PERFORMANCE_CONFIG.get("vector_datatype", "float32")
+vector_np_dtype = np.dtype(vector_datatype)
+# Float embeddings are unit-length, so IP == cosine; int8 vectors carry a per-vector
+# scale, so they need the scale-invariant cosine metric to keep "1 - distance" a similarity
+quantize_int8 = vector_np_dtype == np.int8
+vector_distance_metric = "cosine" if quantize_int8 else "ip"
+
+# Static config read once at import instead of on every request
+openai_model = OPENAI_CONFIG["model"]
+openai_max_tokens = OPENAI_CONFIG["max_tokens"]
+openai_temperature = OPENAI_CONFIG["temperature"]
+semantic_cache_enabled = PERFORMANCE_CONFIG.get("enable_semantic_cache", True)
+cache_similarity_threshold = PERFORMANCE_CONFIG["cache_similarity_threshold"]
+cache_ttl = PERFORMANCE_CONFIG["cache_ttl"]
+embedding_cache_size = PERFORMANCE_CONFIG.get("embedding_cache_size", 1000)
+# In-process front for the semantic cache: exact repeats skip Redis. Entries live
+# at most local_cache_ttl seconds and never past the Redis entry's own expiry, but
+# a cache clear or invalidation in another worker is only seen once they expire
+local_cache_enabled = PERFORMANCE_CONFIG.get("enable_local_cache", True)
+local_cache_ttl = min(PERFORMANCE_CONFIG.get("local_cache_ttl", 60), cache_ttl)
+local_cache_size = PERFORMANCE_CONFIG.get("local_cache_size", 1024)
+vector_dim = PERFORMANCE_CONFIG["vector_dim"]  # replaced by the model's dimension at startup
+
 # Logging utilities with conditional evaluation for performance
 def perf_log(message, *args):
     """Performance logging - only logs if timing logs enabled"""
-    if enable_timing_logs and logger.isEnabledFor(logging.INFO):
-        if args:
-            logger.info(message % args)
-        else:
-            logger.info(message)
+    if enable_timing_logs:
+        # logger formats lazily, only when the record is actually emitted
+        logger.info(message, *args)
 
 def debug_log(message, *args):
     """Debug logging - only logs if debug level enabled"""
-    if logger.isEnabledFor(logging.DEBUG):
-        if args:
-            logger.debug(message % args)
-        else:
-            logger.debug(message)
+    logger.debug(message, *args)
+
+# (epoch second, ISO string) - timestamps only need second resolution
+iso_timestamp_cache = (0, "")
+
+def iso_now():
+    """Current local time as an ISO string, formatted at most once per second"""
+    global iso_timestamp_cache
+    now = int(time.time())
+    if now != iso_timestamp_cache[0]:
+        iso_timestamp_cache = (now, datetime.fromtimestamp(now).isoformat())
+    return iso_timestamp_cache[1]
 
 # Initialize FastAPI application
 app = FastAPI(
     title="Redis MCP Tool Selection Demo",
     description="Cut costs. Increase accuracy. Boost performance.",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse
 )
 
 app.add_middleware(
@@ -81,8 +117,6 @@ class ToolEmbeddings:
         """Initialize embedding model with performance optimizations"""
         try:
             from sentence_transformers import SentenceTransformer
-            from functools import lru_cache
-            import hashlib
             
             print(f"Loading embedding model: {model_name}...")
             self.model = SentenceTransformer(model_name)
@@ -90,10 +124,12 @@ class ToolEmbeddings:
             self.available = True
             
             # Initialize embedding cache for performance optimization
-            self._embedding_cache = {}
+            self._embedding_cache = OrderedDict()
             self._cache_hits = 0
             self._cache_misses = 0
-            self._max_cache_size = PERFORMANCE_CONFIG.get("embedding_cache_size", 1000)
+            self._max_cache_size = embedding_cache_size
+            # Queries embed in worker threads, so LRU reordering/eviction must be serialized
+            self._cache_lock = threading.Lock()
             
             print(f"Embedding model loaded successfully. Dimension: {self.dimension}, Cache size: {self._max_cache_size}")
         except ImportError as e:
@@ -109,30 +145,78 @@ class ToolEmbeddings:
         if not text or not text.strip():
             raise ValueError("Text cannot be empty for embedding generation")
         
-        # Create cache key from text hash
-        import hashlib
-        cache_key = hashlib.md5(text.encode('utf-8')).hexdigest()
+        # Create cache key from text hash (64-bit int, cheap to hash in dicts)
+        cache_key = xxhash.xxh3_64_intdigest(text)
         
         # Check cache first
-        if cache_key in self._embedding_cache:
-            self._cache_hits += 1
-            return self._embedding_cache[cache_key]
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return cached
         
         try:
             # Generate embedding
-            embedding = self.model.encode(text, convert_to_numpy=True).astype(np.float32)
+            # Unit-length vectors: inner product equals cosine similarity
+            embedding = self.model.encode(text, convert_to_numpy=True, normalize_embeddings=True).astype(np.float32, copy=False)
+            self._cache_store(cache_key, embedding)
+            return embedding
+        except Exception as e:
+            raise RuntimeError(f"SentenceTransformer embedding failed: {e}")
+    
+    def generate_embeddings_batch(self, texts):
+        """Generate embeddings for many texts with a single batched encode call"""
+        embeddings = [None] * len(texts)
+        uncached_texts = []
+        uncached_indices = []
+        
+        # Serve what we can from cache, collect the misses
+        for i, text in enumerate(texts):
+            if not text or not text.strip():
+                raise ValueError("Text cannot be empty for embedding generation")
+            cache_key = xxhash.xxh3_64_intdigest(text)
+            cached = self._cache_get(cache_key)
+            if cached is not None:
+                embeddings[i] = cached
+            else:
+                uncached_texts.append(text)
+                uncached_indices.append((i, cache_key))
+        
+        if uncached_texts:
+            try:
+                encoded = self.model.encode(
+                    uncached_texts, batch_size=64, convert_to_numpy=True, normalize_embeddings=True
+                ).astype(np.float32, copy=False)
+            except Exception as e:
+                raise RuntimeError(f"SentenceTransformer batch embedding failed: {e}")
             
-            # Cache with size limit (LRU-like behavior)
+            for (i, cache_key), embedding in zip(uncached_indices, encoded):
+                self._cache_store(cache_key, embedding)
+                embeddings[i] = embedding
+        
+        return np.stack(embeddings) if embeddings else np.empty((0, self.dimension), dtype=np.float32)
+    
+    def warmup(self):
+        """Run one throwaway encode so the first real query skips model warm-up cost"""
+        # Bypasses the embedding cache so hit/miss stats only reflect real traffic
+        self.model.encode("warmup", convert_to_numpy=True, normalize_embeddings=True)
+    
+    def _cache_get(self, cache_key):
+        """Return a cached embedding (marking it most recently used), or None"""
+        with self._cache_lock:
+            embedding = self._embedding_cache.get(cache_key)
+            if embedding is not None:
+                self._cache_hits += 1
+                self._embedding_cache.move_to_end(cache_key)
+            return embedding
+    
+    def _cache_store(self, cache_key, embedding):
+        """Insert an embedding into the cache with size limit (LRU eviction)"""
+        with self._cache_lock:
             if len(self._embedding_cache) >= self._max_cache_size:
-                # Remove oldest entry
-                oldest_key = next(iter(self._embedding_cache))
-                del self._embedding_cache[oldest_key]
+                # Remove least recently used entry
+                self._embedding_cache.popitem(last=False)
             
             self._embedding_cache[cache_key] = embedding
             self._cache_misses += 1
-            return embedding
-        except Exception as e:
-            raise RuntimeError(f"SentenceTransformer embedding failed: {e}")
     
     def get_cache_stats(self):
         """Get embedding cache statistics"""
@@ -149,13 +233,25 @@ class ToolEmbeddings:
         """Convert numpy array to bytes for redis storage (redis-movie-search pattern)"""
         if embedding is None:
             return None
-        return struct.pack(f'{len(embedding)}f', *embedding)
+        if quantize_int8:
+            # Scale so the largest component maps to +/-127 (cosine ignores the scale)
+            embedding = np.asarray(embedding, dtype=np.float32)
+            peak = np.abs(embedding).max()
+            if peak > 0:
+                embedding = np.rint(embedding * (127 / peak))
+        return np.ascontiguousarray(embedding, dtype=vector_np_dtype).tobytes()
     
     def bytes_to_embedding(self, bytes_data):
         """Convert bytes back to numpy array"""
         if not bytes_data:
             return None
-        return np.array(struct.unpack(f'{len(bytes_data)//4}f', bytes_data))
+        embedding = np.frombuffer(bytes_data, dtype=vector_np_dtype)
+        if quantize_int8:
+            # Per-vector scale is not stored; return the unit-length direction
+            embedding = embedding.astype(np.float32)
+            norm = np.linalg.norm(embedding)
+            return embedding / norm if norm > 0 else embedding
+        return embedding
 
 class LLMService:
     """
@@ -165,9 +261,33 @@ class LLMService:
     tools from a provided set, returning structured responses with
     performance metrics.
     """
+    # Tool sets are static per boot, so only a handful of distinct prompts exist
+    MAX_PROMPT_CACHE_SIZE = 256
+    MAX_TOKEN_CACHE_SIZE = 1024
+    
+    # Structured output: the API guarantees a parseable {"tool_names": [...]} reply
+    TOOL_SELECTION_FORMAT = {
+        "type": "json_schema",
+        "json_schema": {
+            "name": "tool_selection",
+            "strict": True,
+            "schema": {
+                "type": "object",
+                "properties": {
+                    "tool_names": {"type": "array", "items": {"type": "string"}}
+                },
+                "required": ["tool_names"],
+                "additionalProperties": False
+            }
+        }
+    }
+    
     def __init__(self):
         self.client = None
         self.tokenizer = None
+        self._static_prompt_cache = {}
+        self._tool_schema_text = {}  # Tool name -> rendered type/description/parameters
+        self._token_count_cache = {}  # Text -> tiktoken count
         
     def initialize(self):
         """Initialize OpenAI client and tokenizer"""
@@ -176,9 +296,15 @@ class LLMService:
             return False
             
         try:
-            self.client = openai.OpenAI(api_key=OPENAI_CONFIG["api_key"])
-            self.tokenizer = tiktoken.encoding_for_model(OPENAI_CONFIG["model"])
-            logger.info(f"OpenAI client initialized with model: {OPENAI_CONFIG['model']}")
+            # Native async client: no thread hop per request, pooled keep-alive connections
+            self.client = openai.AsyncOpenAI(
+                api_key=OPENAI_CONFIG["api_key"],
+                http_client=httpx.AsyncClient(
+                    limits=httpx.Limits(max_connections=100, max_keepalive_connections=20)
+                )
+            )
+            self.tokenizer = tiktoken.encoding_for_model(openai_model)
+            logger.info(f"OpenAI client initialized with model: {openai_model}")
             return True
         except Exception as e:
             logger.error(f"OpenAI initialization failed: {e}")
@@ -189,6 +315,7 @@ class LLMService:
         Count tokens in text using tiktoken.
         
         Falls back to character-based estimation if tokenizer unavailable.
+        Results are memoized per text since demo queries repeat often.
         
         Args:
             text: Text to tokenize
@@ -199,7 +326,14 @@ class LLMService:
         if not self.tokenizer:
             # Fallback estimation: ~4 characters per token
             return len(text) // 4
-        return len(self.tokenizer.encode(text))
+        
+        count = self._token_count_cache.get(text)
+        if count is None:
+            count = len(self.tokenizer.encode(text))
+            if len(self._token_count_cache) >= self.MAX_TOKEN_CACHE_SIZE:
+                self._token_count_cache.clear()
+            self._token_count_cache[text] = count
+        return count
     
     def format_tools_for_llm(self, tools: List[Dict[str, Any]]) -> str:
         """
@@ -216,36 +350,84 @@ class LLMService:
         """
         formatted_tools = []
         for tool in tools:
-            # Use full realistic tool definition for LLM context
-            full_tool = None
-            for server_name, server_tools in TOOLS_CONFIG.items():
-                for t in server_tools:
-                    if t["name"] == tool["name"]:
-                        full_tool = t
-                        break
-                if full_tool:
-                    break
+            # Use full realistic tool definition for LLM context (O(1) lookup)
+            full_tool = tool_lookup_cache.get(tool["name"])
             
             if not full_tool:
                 continue
                 
-            tool_text = f"""Tool: {full_tool['name']}
-Server: {tool.get('server', 'unknown')}
-Type: {full_tool.get('type', 'read')}
-Description: {full_tool['description']}"""
+            # Tool schemas are static: walk each inputSchema once, reuse the text after
+            schema_text = self._tool_schema_text.get(full_tool["name"])
+            if schema_text is None:
+                schema_text = self._tool_schema_text[full_tool["name"]] = self.render_tool_schema(full_tool)
             
-            # Handle MCP inputSchema format
-            if 'inputSchema' in full_tool and 'properties' in full_tool['inputSchema']:
-                tool_text += "\nParameters:\n"
-                required_params = full_tool['inputSchema'].get('required', [])
-                for param_name, param_info in full_tool['inputSchema']['properties'].items():
-                    required_str = " (required)" if param_name in required_params else " (optional)"
-                    tool_text += f"  - {param_name} ({param_info['type']}){required_str}: {param_info['description']}\n"
-            
-            formatted_tools.append(tool_text)
+            formatted_tools.append(
+                f"Tool: {full_tool['name']}\nServer: {tool.get('server', 'unknown')}\n{schema_text}"
+            )
         
         return "\n\n".join(formatted_tools)
     
+    @staticmethod
+    def render_tool_schema(full_tool: Dict[str, Any]) -> str:
+        """
+        Render a tool's type, description and parameters for LLM context.
+        
+        Args:
+            full_tool: Full tool definition with MCP inputSchema
+        
+        Returns:
+            Formatted text block (without the tool and server lines)
+        """
+        parts = [
+            f"Type: {full_tool.get('type', 'read')}",
+            f"Description: {full_tool['description']}"
+        ]
+        
+        # Handle MCP inputSchema format
+        if 'inputSchema' in full_tool and 'properties' in full_tool['inputSchema']:
+            parts.append("Parameters:")
+            required_params = set(full_tool['inputSchema'].get('required', []))
+            for param_name, param_info in full_tool['inputSchema']['properties'].items():
+                required_str = " (required)" if param_name in required_params else " (optional)"
+                parts.append(f"  - {param_name} ({param_info['type']}){required_str}: {param_info['description']}")
+        
+        return "\n".join(parts)
+    
+    def get_static_prompt(self, tools: List[Dict[str, Any]]) -> tuple:
+        """
+        Build the static part of the tool-selection prompt.
+        
+        Instructions and tool context depend only on the tool set, so the
+        prefix and its token count are memoized per set of tool names.
+        Keeping it ahead of the query gives OpenAI prompt caching an exact
+        prefix match across requests.
+        
+        Args:
+            tools: List of tool dictionaries
+        
+        Returns:
+            Tuple of (prompt prefix, prefix token count, tool context length)
+        """
+        cache_key = tuple(tool["name"] for tool in tools)
+        cached = self._static_prompt_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        
+        tools_context = self.format_tools_for_llm(tools)
+        static_prompt = f"""You are an expert system administrator helping with operational tasks. Given the following available MCP tools and query, select the 1 most relevant tools that would be needed to address this request. Make sure you choose correctly review all the options provided to you, think deeply.
+
+Available Tools:
+{tools_context}
+
+Respond with the names of the tools that are most relevant to the query in "tool_names". Be selective - choose only the tools that are directly needed.
+
+"""
+        cached = (static_prompt, self.count_tokens(static_prompt), len(tools_context))
+        if len(self._static_prompt_cache) >= self.MAX_PROMPT_CACHE_SIZE:
+            self._static_prompt_cache.clear()
+        self._static_prompt_cache[cache_key] = cached
+        return cached
+    
     async def select_relevant_tools(self, query: str, all_tools: List[Dict[str, Any]]) -> Dict[str, Any]:
         """
         Use LLM to select relevant tools for a query.
@@ -263,27 +445,16 @@ Description: {full_tool['description']}"""
             raise Exception("OpenAI client not initialized")
         
         start_time = time.time()
-        logger.info(f"LLM_SELECTION_START: tools_available={len(all_tools)} model={OPENAI_CONFIG['model']}")
+        logger.info(f"LLM_SELECTION_START: tools_available={len(all_tools)} model={openai_model}")
         
-        # Format all tools for LLM context
-        tools_context = self.format_tools_for_llm(all_tools)
-        context_length = len(tools_context)
+        # Static instructions + tool context (memoized), query goes last
+        static_prompt, static_tokens, context_length = self.get_static_prompt(all_tools)
         logger.info(f"LLM_CONTEXT_PREPARED: context_chars={context_length} tools_formatted={len(all_tools)}")
         
-        # Count input tokens
-        input_prompt = f"""You are an expert system administrator helping with operational tasks. Given the following query and available MCP tools, select the 1 most relevant tools that would be needed to address this request. Make sure you choose correctly review all the options provided to you, think deeply.
-
-Query: {query}
-
-Available Tools:
-{tools_context}
-
-Please respond with ONLY a JSON array of tool names that are most relevant to this query. Be selective - choose only the tools that are directly needed.
-
-Example response format:
-["tool.name1", "tool.name2", "tool.name3"]"""
-
-        input_tokens = self.count_tokens(input_prompt)
+        # Count input tokens - only the per-request suffix needs tokenizing
+        query_prompt = f"Query: {query}"
+        input_prompt = static_prompt + query_prompt
+        input_tokens = static_tokens + self.count_tokens(query_prompt)
         
         # Professional logging for demo transparency
         avg_tokens_per_tool = input_tokens / len(all_tools) if all_tools else 0
@@ -292,20 +463,21 @@ Example response format:
         logger.info(f"REASONING_CHALLENGE: tools_to_evaluate={len(all_tools)} selection_complexity=high")
         
         try:
-            response = await asyncio.to_thread(
-                self.client.chat.completions.create,
-                model=OPENAI_CONFIG["model"],
+            response = await self.client.chat.completions.create(
+                model=openai_model,
                 messages=[{"role": "user", "content": input_prompt}],
-                max_tokens=OPENAI_CONFIG["max_tokens"],
-                temperature=OPENAI_CONFIG["temperature"],
-                timeout=30  
+                max_tokens=openai_max_tokens,
+                temperature=openai_temperature,
+                timeout=30,
+                response_format=self.TOOL_SELECTION_FORMAT,
+                extra_body={"prompt_cache_key": "mcp-tool-selection-v1"}
             )
             
             end_time = time.time()
             latency = round(end_time - start_time, 3)
             
             # Parse LLM response
-            selected_tools_text = response.choices[0].message.content.strip()
+            selected_tools_text = (response.choices[0].message.content or "").strip()
             output_tokens = self.count_tokens(selected_tools_text)
             total_tokens = input_tokens + output_tokens
             
@@ -313,28 +485,16 @@ Example response format:
             cost = (input_tokens * 0.00000425 + output_tokens * 0.000017)
             
             try:
-                import json
-                # Clean up markdown code blocks if present
-                clean_text = selected_tools_text.strip()
-                if clean_text.startswith("```json"):
-                    clean_text = clean_text[7:]  # Remove ```json
-                if clean_text.endswith("```"):
-                    clean_text = clean_text[:-3]  # Remove ```
-                clean_text = clean_text.strip()
-                
-                selected_tool_names = json.loads(clean_text)
+                # Structured output - no markdown fences to strip
+                selected_tool_names = orjson.loads(selected_tools_text)["tool_names"]
                 
                 # Ensure we have a list
                 if not isinstance(selected_tool_names, list):
                     selected_tool_names = []
                 
-                # Find the full tool objects
-                selected_tools = []
-                for tool_name in selected_tool_names:
-                    for tool in all_tools:
-                        if tool["name"] == tool_name:
-                            selected_tools.append(tool)
-                            break
+                # Find the full tool objects, keeping the LLM's ranking order
+                all_tools_by_name = {tool["name"]: tool for tool in all_tools}
+                selected_tools = [all_tools_by_name[name] for name in selected_tool_names if name in all_tools_by_name]
                 
                 # If no tools selected, use fallback
                 if len(selected_tools) == 0 and len(all_tools) > 0:
@@ -354,7 +514,7 @@ Example response format:
                 
                 # Log each selected tool
                 for i, tool in enumerate(selected_tools, 1):
-                    server = next((s for s, tools in TOOLS_CONFIG.items() for t in tools if t['name'] == tool['name']), 'unknown')
+                    server = tool_lookup_cache.get(tool['name'], {}).get('server', 'unknown')
                     logger.info(f"LLM_SELECTED_TOOL: rank={i} name={tool['name']} server={server} type={tool['type']}")
                 
                 return {
@@ -367,7 +527,8 @@ Example response format:
                     "llm_response": selected_tools_text
                 }
                 
-            except json.JSONDecodeError:
+            except (orjson.JSONDecodeError, KeyError, TypeError):
+                # Only reachable on truncated (max_tokens) or refused replies
                 logger.error(f"LLM_PARSE_ERROR: response_text={selected_tools_text[:200]}{'...' if len(selected_tools_text) > 200 else ''}")
                 fallback_tools = all_tools[:5]
                 logger.info(f"LLM_FALLBACK: tools_selected={len(fallback_tools)} method=first_n reason=parse_error")
@@ -393,11 +554,17 @@ Example response format:
 redis_client = None
 sync_redis_client = None
 llm_service = None
-search_index = None
+search_index = None  # Live tool index epoch, for writes and maintenance
+tool_query_index = None  # Tool index bound to the alias: every search goes through it
+tool_index_epoch = 0  # Version of the live tool index (mcp_tools_v<epoch>)
 cache_index = None
 is_redis_connected = False
 tool_embeddings = None  # Real embedding service
 tool_lookup_cache = {}  # Precomputed tool lookup cache
+embedding_text_cache = {}  # Precomputed enhanced embedding text per tool name
+all_tools_cache = []  # Every tool with its server, in TOOLS_CONFIG order
+all_tools_json = b"[]"  # all_tools_cache serialized once, served as-is by /api/tools
+all_tools_json_gzip = gzip.compress(all_tools_json)  # Same body, compressed once for gzip clients
 
 # Request/Response Models
 class ChatRequest(BaseModel):
@@ -427,6 +594,21 @@ class HealthResponse(BaseModel):
 # Load MCP tool definitions from configuration
 TOOLS_CONFIG = MCP_TOOLS_CONFIG
 
+# Domain keywords appended to each tool's embedding text, keyed by lowercase server name
+SERVER_CONTEXT = {
+    "zendesk": "customer support helpdesk ticketing customer service external customers end-users",
+    "jira": "project management internal issues development bugs tasks sprint agile",
+    "hubspot": "sales marketing CRM deals leads pipeline revenue",
+    "pagerduty": "incident response on-call alerts engineering teams escalation",
+    "datadog": "application monitoring APM logs metrics observability infrastructure",
+    "confluence": "documentation wiki knowledge base articles pages collaboration",
+    "m365": "microsoft office email teams sharepoint outlook calendar",
+    "snowflake": "data warehouse SQL analytics database queries reporting"
+}
+
+# Seconds a command waits for a free pooled connection before failing
+REDIS_POOL_TIMEOUT = 5
+
 async def initialize_redis():
     """
     Initialize Redis connection and vector search indexes.
@@ -434,16 +616,30 @@ async def initialize_redis():
     Sets up both async and sync Redis clients for compatibility
     with RedisVL, and creates HNSW indexes for tool and cache search.
     """
-    global redis_client, sync_redis_client, search_index, cache_index, is_redis_connected
+    global redis_client, sync_redis_client, cache_index, is_redis_connected
     
     try:
-        # Create both async and sync redis clients (RedisVL needs sync client)
-        redis_client = redis.from_url(REDIS_CONFIG["url"], decode_responses=True)
+        # Create both async and sync redis clients (RedisVL needs sync client).
+        # Neither decodes responses: embeddings are raw vector bytes, RedisVL
+        # converts hash results itself, and no other reply is read as text.
+        # Each client owns one bounded, shared connection pool for the app lifetime.
+        # Blocking pools make callers wait for a free connection under load
+        # instead of failing with "Too many connections".
+        redis_client = redis.Redis(
+            connection_pool=redis.BlockingConnectionPool.from_url(
+                REDIS_CONFIG["url"], max_connections=50, timeout=REDIS_POOL_TIMEOUT
+            )
+        )
         
-        # Also create sync client for RedisVL
+        # Also create sync client for RedisVL; its callers run in the default
+        # asyncio.to_thread executor, so the pool matches that executor's size
         import redis as sync_redis
         global sync_redis_client
-        sync_redis_client = sync_redis.from_url(REDIS_CONFIG["url"], decode_responses=True)
+        sync_redis_client = sync_redis.Redis(
+            connection_pool=sync_redis.BlockingConnectionPool.from_url(
+                REDIS_CONFIG["url"], max_connections=min(32, (os.cpu_count() or 1) + 4), timeout=REDIS_POOL_TIMEOUT
+            )
+        )
         
         # Test connection
         await redis_client.ping()
@@ -458,37 +654,147 @@ async def initialize_redis():
         logger.info("Demo will run in mock mode")
         is_redis_connected = False
 
+# The tool index is versioned: each rebuild creates mcp_tools_v<epoch+1> under its
+# own key prefix, and this alias is repointed once the new index is fully populated
+TOOL_INDEX_ALIAS = "mcp_tools"
+
+def build_tool_schema(epoch: int) -> Dict[str, Any]:
+    """Tool search index schema for one index epoch (versioned name and key prefix)."""
+    return {
+        "index": {
+            "name": f"{TOOL_INDEX_ALIAS}_v{epoch}",
+            "prefix": f"tool:v{epoch}:",
+            "storage_type": "hash",
+        },
+        "fields": [
+            {"name": "name", "type": "text"},
+            {"name": "description", "type": "text"},
+            {"name": "server", "type": "text"}, 
+            {"name": "type", "type": "text"},
+            {"name": "embedding", "type": "vector", "attrs": {
+                "dims": vector_dim,
+                "distance_metric": vector_distance_metric,
+                "algorithm": "hnsw",
+                "datatype": vector_datatype
+            }}
+        ]
+    }
+
+def stored_vector_matches_format(key: str) -> bool:
+    """
+    Check that a stored embedding has the configured vector size.
+    
+    Changing vector_datatype (e.g. float16 -> int8) changes the byte length
+    of every vector, so a mismatch means the index was built for another format.
+    
+    Args:
+        key: Hash key holding an "embedding" field
+        
+    Returns:
+        False only when the key holds an embedding of the wrong size
+    """
+    stored = sync_redis_client.hget(key, "embedding")
+    return stored is None or len(stored) == vector_dim * vector_np_dtype.itemsize
+
+def parse_tool_index_epoch(index_name: str) -> Optional[int]:
+    """Epoch of a versioned tool index name (mcp_tools_v<epoch>), or None."""
+    versioned_prefix = f"{TOOL_INDEX_ALIAS}_v"
+    if index_name.startswith(versioned_prefix) and index_name[len(versioned_prefix):].isdigit():
+        return int(index_name[len(versioned_prefix):])
+    return None
+
+def read_aliased_tool_index() -> Optional[str]:
+    """Name of the index the tool alias points at, or None when it is not set."""
+    try:
+        index_name = sync_redis_client.ft(TOOL_INDEX_ALIAS).info()["index_name"]
+    except Exception:
+        return None
+    return index_name.decode() if isinstance(index_name, bytes) else index_name
+
+def resolve_tool_index_epoch() -> int:
+    """
+    Find the epoch of the tool index the alias currently points at.
+    
+    Returns:
+        Live epoch, the next epoch when the live one was dropped for holding
+        vectors of another datatype, or 0 when no versioned tool index exists yet
+    """
+    index_name = read_aliased_tool_index()
+    if index_name is None:
+        return 0
+    
+    epoch = parse_tool_index_epoch(index_name)
+    if epoch is not None:
+        sample_tool = next(iter(tool_lookup_cache), None)
+        if sample_tool is None or stored_vector_matches_format(f"tool:v{epoch}:{sample_tool}"):
+            return epoch
+        # Built for another vector datatype - rebuild under the next epoch
+        sync_redis_client.ft(index_name).dropindex(delete_documents=True)
+        logger.info(f"Dropped tool index '{index_name}' - vectors are not {vector_datatype}, rebuilding")
+        return epoch + 1
+    
+    # Unversioned index from before epochs (its "tool:" prefix would also cover
+    # the versioned keys) - drop it with its documents and start over
+    sync_redis_client.ft(index_name).dropindex(delete_documents=True)
+    logger.info(f"Dropped unversioned tool index '{index_name}' - rebuilding as a versioned index")
+    return 0
+
+def drop_retired_tool_indexes(live_epoch: int):
+    """
+    Drop tool index epochs older than the live one.
+    
+    Rebuilds retire the previous epoch after a grace period; this catches any
+    a process did not get to (e.g. it exited first). Newer epochs are left
+    alone, as another worker may be building one.
+    
+    Args:
+        live_epoch: Epoch the alias points at
+    """
+    for index_name in sync_redis_client.execute_command("FT._LIST"):
+        if isinstance(index_name, bytes):
+            index_name = index_name.decode()
+        epoch = parse_tool_index_epoch(index_name)
+        if epoch is not None and epoch < live_epoch:
+            sync_redis_client.ft(index_name).dropindex(delete_documents=True)
+            logger.info(f"Dropped retired tool index '{index_name}'")
+
+def bind_tool_indexes(epoch: int):
+    """Point search_index at a tool index epoch (tool_query_index always follows the alias)."""
+    global search_index, tool_query_index, tool_index_epoch
+    
+    tool_schema = build_tool_schema(epoch)
+    search_index = SearchIndex.from_dict(tool_schema)
+    search_index.set_client(sync_redis_client)
+    tool_index_epoch = epoch
+    
+    if tool_query_index is None:
+        # Queries resolve the alias server-side, so a rebuild by any worker is
+        # picked up without this process having to notice
+        alias_schema = {**tool_schema, "index": {**tool_schema["index"], "name": TOOL_INDEX_ALIAS}}
+        tool_query_index = SearchIndex.from_dict(alias_schema)
+        tool_query_index.set_client(sync_redis_client)
+
+async def sync_live_tool_index():
+    """Follow the alias to the live epoch, which another worker may have rebuilt."""
+    index_name = await asyncio.to_thread(read_aliased_tool_index)
+    epoch = parse_tool_index_epoch(index_name) if index_name else None
+    if epoch is not None and epoch != tool_index_epoch:
+        bind_tool_indexes(epoch)
+        logger.info(f"Tool index epoch {epoch} is live (rebuilt by another worker)")
+
 async def setup_redisvl_indexes():
     """
     Configure RedisVL vector search indexes.
     
     Creates two HNSW indexes:
-    1. Tool index - for finding relevant MCP tools
+    1. Tool index - for finding relevant MCP tools (live epoch, via alias)
     2. Cache index - for semantic similarity matching of queries
     """
-    global search_index, cache_index
+    global cache_index
     
     try:
-        # Tool search index schema
-        tool_schema = {
-            "index": {
-                "name": "mcp_tools",
-                "prefix": "tool:",
-                "storage_type": "hash",
-            },
-            "fields": [
-                {"name": "name", "type": "text"},
-                {"name": "description", "type": "text"},
-                {"name": "server", "type": "text"}, 
-                {"name": "type", "type": "text"},
-                {"name": "embedding", "type": "vector", "attrs": {
-                    "dims": PERFORMANCE_CONFIG["vector_dim"],
-                    "distance_metric": "cosine",
-                    "algorithm": "hnsw",
-                    "datatype": "float32"
-                }}
-            ]
-        }
+        # Attach to the live tool index epoch, or start at epoch 1
+        bind_tool_indexes(resolve_tool_index_epoch() or 1)
         
         # Semantic cache index schema  
         cache_schema = {
@@ -503,21 +809,18 @@ async def setup_redisvl_indexes():
                 {"name": "tools_used", "type": "text"},
                 {"name": "cached_at", "type": "text"},
                 {"name": "embedding", "type": "vector", "attrs": {
-                    "dims": PERFORMANCE_CONFIG["vector_dim"],
-                    "distance_metric": "cosine", 
+                    "dims": vector_dim,
+                    "distance_metric": vector_distance_metric,
                     "algorithm": "hnsw",
-                    "datatype": "float32"
+                    "datatype": vector_datatype
                 }}
             ]
         }
         
         # Create indexes using Redis client (following aws-redis-fin-agent pattern)
-        global search_index, cache_index
-        search_index = SearchIndex.from_dict(tool_schema)
         cache_index = SearchIndex.from_dict(cache_schema)
         
         # Set sync client for RedisVL (it needs synchronous Redis client)
-        search_index.set_client(sync_redis_client)
         cache_index.set_client(sync_redis_client)
         
         # Create indexes only if they don't exist (preserve cache data)
@@ -529,42 +832,88 @@ async def setup_redisvl_indexes():
             except:
                 search_index.create(overwrite=False, drop=False)
                 logger.info("Tool search index created")
+            sync_redis_client.ft(search_index.name).aliasupdate(TOOL_INDEX_ALIAS)
+            drop_retired_tool_indexes(tool_index_epoch)
                 
-            # Check cache index - use direct Redis check to avoid clearing existing data
-            existing_cache_keys = sync_redis_client.keys("supportAssistant:cache:*")
-            if existing_cache_keys:
-                logger.info(f"Cache index already exists with {len(existing_cache_keys)} cached items - preserving all data")
-                # Don't touch the cache index at all if data exists
-            else:
-                try:
-                    cache_index.info()
-                    logger.info("Cache index exists but empty")
-                except:
+            # Check cache index - FT.INFO doc count instead of a KEYS scan (never clears existing data)
+            try:
+                cached_items = int(cache_index.info()["num_docs"])
+                sample = sync_redis_client.ft(cache_index.name).search(Query("*").no_content().paging(0, 1)).docs
+                if sample and not stored_vector_matches_format(sample[0].id):
+                    # Cached vectors are in another datatype - the cache is disposable, start over
+                    sync_redis_client.ft(cache_index.name).dropindex(delete_documents=True)
                     cache_index.create(overwrite=False, drop=False)
-                    logger.info("Cache index created (no existing data)")
+                    logger.info(f"Cache index recreated for {vector_datatype} vectors ({cached_items} stale entries dropped)")
+                else:
+                    logger.info(f"Cache index already exists with {cached_items} cached items - preserving all data")
+            except:
+                cache_index.create(overwrite=False, drop=False)
+                logger.info("Cache index created")
         except Exception as e:
             logger.warning(f"Index creation warning: {e}")
         
         # Index tools with real embeddings (only if needed)
-        await index_tools_with_embeddings()
+        await index_tools_with_embeddings(search_index)
         
         logger.info("RedisVL indexes initialized successfully")
         
     except Exception as e:
         logger.warning(f"RedisVL index setup failed: {e}")
 
-async def index_tools_with_embeddings():
+# Tools embedded per worker-thread call during indexing
+INDEX_EMBED_BATCH_SIZE = 64
+
+async def store_tool_docs(index: SearchIndex, tool_docs: List[Dict[str, Any]]) -> int:
+    """
+    Write tool documents into an index with one pipelined round trip.
+    
+    Args:
+        index: Tool index (epoch) whose key prefix the documents go under
+        tool_docs: Tool documents with float32 embeddings
+        
+    Returns:
+        Number of tools stored
+    """
+    async with redis_client.pipeline(transaction=False) as pipe:
+        for tool_doc in tool_docs:
+            embedding_bytes = tool_embeddings.embedding_to_bytes(tool_doc["embedding"])
+            pipe.hset(f"{index.prefix}{tool_doc['name']}", mapping={
+                "name": tool_doc["name"],
+                "description": tool_doc["description"], 
+                "server": tool_doc["server"],
+                "type": tool_doc["type"],
+                "embedding": embedding_bytes,
+                "text_hash": tool_doc["text_hash"]
+            })
+            logger.debug(f"Queued {tool_doc['name']}: embedding_size={len(embedding_bytes)} bytes")
+        
+        # Per-command errors come back as results instead of aborting the batch
+        stored_count = 0
+        for tool_doc, result in zip(tool_docs, await pipe.execute(raise_on_error=False)):
+            if isinstance(result, Exception):
+                logger.error(f"Failed to store {tool_doc['name']}: {result}")
+            else:
+                stored_count += 1
+    return stored_count
+
+async def index_tools_with_embeddings(index: SearchIndex):
     """
     Index all MCP tools with their embeddings in RedisVL.
     Only indexes if tools are not already present in Redis.
+    
+    Args:
+        index: Tool index (epoch) to populate, under its own key prefix
     """
-    if not is_redis_connected or not search_index:
+    if not is_redis_connected or not index:
         logger.warning("Skipping tool indexing: Redis not connected or search index missing")
         return
     
     try:
-        # Check if tools are already indexed by checking a sample tool
-        existing_count = len(sync_redis_client.keys("tool:*"))
+        # Check if tools are already indexed using the FT.INFO doc count (no KEYS scan)
+        try:
+            existing_count = int((await asyncio.to_thread(index.info))["num_docs"])
+        except Exception:
+            existing_count = 0
         expected_count = sum(len(tools) for tools in TOOLS_CONFIG.values())
         
         if existing_count >= expected_count:
@@ -577,43 +926,75 @@ async def index_tools_with_embeddings():
         
         logger.info(f"Starting tool embedding generation for {sum(len(tools) for tools in TOOLS_CONFIG.values())} tools...")
         
-        # Generate real embeddings for all tools using enhanced text
+        # Build enhanced embedding text for every tool first
+        tool_entries = []
         for server_name, tools in TOOLS_CONFIG.items():
             perf_log("EMBEDDING_GENERATION: Processing %s server with %d tools", server_name, len(tools))
             
             for tool in tools:
-                # Enhanced embedding text that includes full context
-                tool_text = generate_enhanced_embedding_text(tool, server_name)
+                # Enhanced embedding text that includes full context (built at startup)
+                tool_text = embedding_text_cache[tool["name"]]
                 
                 # Log sample of enhanced text for first tool of each server
-                if tools.index(tool) == 0:
+                if tool is tools[0]:
                     debug_log("EMBEDDING_SAMPLE: %s tool text length=%d chars", server_name, len(tool_text))
                 
-                # Generate real embedding using SentenceTransformers 
+                tool_entries.append((server_name, tool, tool_text))
+        
+        # Embed in batches on a worker thread; each batch's HSETs go out over the
+        # async client while the next batch is being embedded
+        logger.info("Storing tool embeddings in Redis with vector format...")
+        stored_count = 0
+        write_task = None
+        try:
+            for start in range(0, len(tool_entries), INDEX_EMBED_BATCH_SIZE):
+                batch = tool_entries[start:start + INDEX_EMBED_BATCH_SIZE]
                 try:
-                    embedding_array = tool_embeddings.generate_embedding(tool_text)
-                    embedding = embedding_array.tolist()
-                    embedding_stats["sentence_transformers"] = embedding_stats.get("sentence_transformers", 0) + 1
-                    logger.debug(f"Generated SentenceTransformer embedding for {tool['name']} (dimensions: {len(embedding)})")
+                    embedding_arrays = await asyncio.to_thread(
+                        tool_embeddings.generate_embeddings_batch, [text for _, _, text in batch]
+                    )
+                    embedding_stats["sentence_transformers"] += len(embedding_arrays)
                 except Exception as e:
-                    logger.error(f"CRITICAL: Embedding generation failed for {tool['name']}: {e}")
-                    raise RuntimeError(f"Cannot generate embedding for tool {tool['name']}: {e}")
+                    logger.error(f"CRITICAL: Batch embedding generation failed: {e}")
+                    raise RuntimeError(f"Cannot generate tool embeddings: {e}")
                 
-                # Validate embedding
-                if not isinstance(embedding, list) or len(embedding) != PERFORMANCE_CONFIG["vector_dim"]:
-                    logger.error(f"Invalid embedding for {tool['name']}: type={type(embedding)}, len={len(embedding) if hasattr(embedding, '__len__') else 'N/A'}")
-                    continue
+                batch_docs = []
+                for (server_name, tool, tool_text), embedding in zip(batch, embedding_arrays):
+                    # Rows stay float32 ndarrays all the way to the Redis write
+                    logger.debug(f"Generated SentenceTransformer embedding for {tool['name']} (dimensions: {len(embedding)})")
                 
-                # Prepare data for RedisVL
-                tool_doc = {
-                    "name": tool["name"],
-                    "description": tool["description"], 
-                    "server": server_name,
-                    "type": tool["type"],
-                    "embedding": embedding
-                }
+                    # Validate embedding
+                    if embedding.shape != (vector_dim,):
+                        logger.error(f"Invalid embedding for {tool['name']}: shape={embedding.shape}")
+                        continue
                 
-                tool_data.append(tool_doc)
+                    # Prepare data for RedisVL
+                    batch_docs.append({
+                        "name": tool["name"],
+                        "description": tool["description"], 
+                        "server": server_name,
+                        "type": tool["type"],
+                        "embedding": embedding,
+                        # Digest of the embedding text, lets a reindex skip unchanged tools
+                        "text_hash": xxhash.xxh3_64_hexdigest(tool_text)
+                    })
+                tool_data.extend(batch_docs)
+                
+                if write_task:
+                    previous_write, write_task = write_task, None
+                    stored_count += await previous_write
+                write_task = asyncio.create_task(store_tool_docs(index, batch_docs))
+            if write_task:
+                last_write, write_task = write_task, None
+                stored_count += await last_write
+        finally:
+            if write_task:
+                # A later batch failed - let the pending write finish so it is
+                # not left running (and its errors unread) behind the failure
+                try:
+                    await write_task
+                except Exception as e:
+                    logger.error(f"Tool embedding write failed: {e}")
         
         # Format embedding statistics  
         stats_summary = []
@@ -621,52 +1002,20 @@ async def index_tools_with_embeddings():
             stats_summary.append(f"{embedding_stats['sentence_transformers']} SentenceTransformers")
         
         logger.info(f"Embedding generation complete: {' + '.join(stats_summary)} = {len(tool_data)} total")
-        
-        # Store using direct Redis operations like aws-redis-fin-agent
-        logger.info("Storing tool embeddings in Redis with vector format...")
-        
-        stored_count = 0
-        for tool_doc in tool_data:
-            try:
-                # Convert embedding to bytes format (aws-redis-fin-agent pattern)
-                if isinstance(tool_doc["embedding"], list):
-                    embedding_bytes = np.array(tool_doc["embedding"], dtype=np.float32).tobytes()
-                    
-                    # Use the same key pattern as our schema
-                    key = f"tool:{tool_doc['name']}"
-                    
-                    # Store with embedding as bytes
-                    redis_data = {
-                        "name": tool_doc["name"],
-                        "description": tool_doc["description"], 
-                        "server": tool_doc["server"],
-                        "type": tool_doc["type"],
-                        "embedding": embedding_bytes
-                    }
-                    
-                    # Store using sync Redis client (for RedisVL compatibility)
-                    sync_redis_client.hset(key, mapping=redis_data)
-                    stored_count += 1
-                    
-                    logger.debug(f"Stored {tool_doc['name']}: embedding_size={len(embedding_bytes)} bytes")
-                
-            except Exception as store_error:
-                logger.error(f"Failed to store {tool_doc['name']}: {store_error}")
-        
         logger.info(f"Storage complete: {stored_count}/{len(tool_data)} tools stored with vector embeddings")
         
         # Test vector search on stored data
         logger.info("Testing vector search functionality...")
         try:
-            test_embedding_array = tool_embeddings.generate_embedding("test query")
-            test_embedding = test_embedding_array.tolist()
+            test_embedding = await asyncio.to_thread(tool_embeddings.generate_embedding, "test query")
             test_query = VectorQuery(
-                vector=test_embedding,
-                vector_field_name="embedding", 
+                vector=tool_embeddings.embedding_to_bytes(test_embedding),
+                vector_field_name="embedding",
+                dtype=vector_datatype,
                 return_fields=["name", "description"],
                 num_results=3
             )
-            test_results = search_index.query(test_query)
+            test_results = await asyncio.to_thread(index.query, test_query)
             logger.info(f"Search test successful: Found {len(test_results)} results")
             
             if test_results:
@@ -693,19 +1042,9 @@ def generate_enhanced_embedding_text(tool: Dict[str, Any], server_name: str) ->
     ]
 
     # Add server/service context with domain-specific keywords
-    server_context = {
-        "zendesk": "customer support helpdesk ticketing customer service external customers end-users",
-        "jira": "project management internal issues development bugs tasks sprint agile",
-        "hubspot": "sales marketing CRM deals leads pipeline revenue",
-        "pagerduty": "incident response on-call alerts engineering teams escalation",
-        "datadog": "application monitoring APM logs metrics observability infrastructure",
-        "confluence": "documentation wiki knowledge base articles pages collaboration",
-        "m365": "microsoft office email teams sharepoint outlook calendar",
-        "snowflake": "data warehouse SQL analytics database queries reporting"
-    }
-
-    if server_name.lower() in server_context:
-        text_parts.append(server_context[server_name.lower()])
+    server_lc = server_name.lower()
+    if server_lc in SERVER_CONTEXT:
+        text_parts.append(SERVER_CONTEXT[server_lc])
 
     text_parts.append(f"This {server_name} tool performs {tool['type']} operations.")
     
@@ -743,9 +1082,9 @@ def generate_enhanced_embedding_text(tool: Dict[str, Any], server_name: str) ->
     if 'search' in tool_lower:
         text_parts.append("search query filter find lookup retrieve")
     if 'ticket' in tool_lower or 'ticket' in desc_lower:
-        if server_name.lower() == 'zendesk':
+        if server_lc == 'zendesk':
             text_parts.append("customer tickets support requests customer issues helpdesk")
-        elif server_name.lower() == 'hubspot':
+        elif server_lc == 'hubspot':
             text_parts.append("service hub sales tickets deals pipeline")
     if 'log' in tool_lower:
         text_parts.append("logs logging events errors exceptions")
@@ -760,37 +1099,24 @@ def generate_enhanced_embedding_text(tool: Dict[str, Any], server_name: str) ->
     if 'payment' in desc_lower:
         text_parts.append("payment transactions billing financial money")
     if 'customer' in desc_lower:
-        if server_name.lower() == 'zendesk':
+        if server_lc == 'zendesk':
             text_parts.append("external customers end users support requests")
-        elif server_name.lower() == 'hubspot':
+        elif server_lc == 'hubspot':
             text_parts.append("leads prospects sales opportunities")
     
     # The full text naturally contains the semantic meaning
     return " ".join(text_parts)
 
-async def vector_search_tools(query: str, top_k: int = 3) -> List[Dict[str, Any]]:
+async def vector_search_tools(query: str, query_embedding: np.ndarray, top_k: int = 3) -> List[Dict[str, Any]]:
     start_time = time.time() if enable_timing_logs else None
     
     perf_log("VECTOR_SEARCH_START: query_length=%d top_k=%d", len(query), top_k)
     debug_log("QUERY_TEXT: %s", query[:200] + ('...' if len(query) > 200 else ''))
     
     try:
-        
-        embedding_start = time.time() if enable_timing_logs else None
-        
-        try:
-            embedding_array = tool_embeddings.generate_embedding(query)
-            query_embedding = embedding_array.tolist()
-            if enable_timing_logs:
-                embedding_time = int((time.time() - embedding_start) * 1000)
-                perf_log("EMBEDDING_GENERATED: method=SentenceTransformer time_ms=%d dimensions=%d", embedding_time, len(query_embedding))
-        except Exception as e:
-            logger.error(" CRITICAL: Query embedding generation failed: %s", e)
-            raise RuntimeError(f"Cannot generate embedding for query '{query}': {e}")
-        
         # Validate embedding
-        if not isinstance(query_embedding, list) or len(query_embedding) != PERFORMANCE_CONFIG["vector_dim"]:
-            logger.error(f" EMBEDDING: Invalid query embedding: type={type(query_embedding)}, len={len(query_embedding) if hasattr(query_embedding, '__len__') else 'N/A'}")
+        if query_embedding.shape != (vector_dim,):
+            logger.error(f" EMBEDDING: Invalid query embedding: shape={query_embedding.shape}")
             return []
         
         # Create and execute RedisVL vector query
@@ -798,46 +1124,52 @@ async def vector_search_tools(query: str, top_k: int = 3) -> List[Dict[str, Any]
         debug_log("REDIS_QUERY_START: method=RedisVL vector_field=embedding return_fields=4")
         
         vector_query = VectorQuery(
-            vector=query_embedding,
+            vector=tool_embeddings.embedding_to_bytes(query_embedding),
             vector_field_name="embedding",
+            dtype=vector_datatype,
             return_fields=["name", "description", "server", "type"],
             num_results=top_k
         )
         
-        # Execute the search (RedisVL query is synchronous)
-        results = search_index.query(vector_query)
+        # Execute the search (RedisVL is synchronous, run in thread)
+        results = await asyncio.to_thread(tool_query_index.query, vector_query)
         if enable_timing_logs:
             search_time = int((time.time() - search_start) * 1000)
             perf_log("REDIS_QUERY_COMPLETE: time_ms=%d results_count=%d", search_time, len(results))
         else:
             search_time = 0
         
-        # Process results
-        selected_tools = []
-        for i, result in enumerate(results):
-            similarity_score = round(1 - float(result.get("vector_distance", 1)), 3)
-            tool_data = {
+        # Process results (one elapsed-time reading shared by all results)
+        search_elapsed_ms = int((time.time() - start_time) * 1000) if start_time else 0
+        # Parse every distance (returned as strings) and convert to similarity in one pass
+        distances = np.array([result.get("vector_distance", 1) for result in results], dtype=np.float64)
+        similarities = np.round(1 - distances, 3).tolist()
+        selected_tools = [
+            {
                 "name": result["name"],
                 "description": result["description"],
                 "server": result["server"],
                 "type": result["type"],
-                "similarity": similarity_score,
-                "search_time_ms": int((time.time() - start_time) * 1000) if start_time else 0
+                "similarity": similarity,
+                "search_time_ms": search_elapsed_ms
             }
-            selected_tools.append(tool_data)
-            logger.info(f"TOOL_RANKED: rank={i+1} name={result['name']} server={result['server']} similarity={similarity_score} distance={result.get('vector_distance', 'N/A')}")
+            for result, similarity in zip(results, similarities)
+        ]
+        if logger.isEnabledFor(logging.INFO):
+            for i, tool in enumerate(selected_tools, 1):
+                logger.info("TOOL_RANKED: rank=%d name=%s server=%s similarity=%s distance=%.3f", i, tool['name'], tool['server'], tool['similarity'], 1 - tool['similarity'])
         
         if enable_timing_logs and start_time:
             total_time = int((time.time() - start_time) * 1000)
-            logger.info(f"VECTOR_SEARCH_SUCCESS: tools_selected={len(selected_tools)} total_time_ms={total_time}")
+            logger.info("VECTOR_SEARCH_SUCCESS: tools_selected=%d total_time_ms=%d", len(selected_tools), total_time)
         else:
             total_time = 0
         
-        if selected_tools:
+        if selected_tools and logger.isEnabledFor(logging.INFO):
             best_tool = selected_tools[0]
-            worst_tool = selected_tools[-1] if len(selected_tools) > 1 else best_tool
-            logger.info(f"SIMILARITY_RANGE: best={best_tool['similarity']:.3f} worst={worst_tool['similarity']:.3f}")
-            logger.info(f"TOP_RESULT: name={best_tool['name']} server={best_tool['server']} similarity={best_tool['similarity']:.3f}")
+            worst_tool = selected_tools[-1]
+            logger.info("SIMILARITY_RANGE: best=%.3f worst=%.3f", best_tool['similarity'], worst_tool['similarity'])
+            logger.info("TOP_RESULT: name=%s server=%s similarity=%.3f", best_tool['name'], best_tool['server'], best_tool['similarity'])
         
         return selected_tools
         
@@ -851,36 +1183,68 @@ async def vector_search_tools(query: str, top_k: int = 3) -> List[Dict[str, Any]
         logger.info("FALLBACK_ACTIVATED: method=rule_based reason=vector_search_failed")
         return []
 
-async def check_semantic_cache(query: str) -> Optional[Dict[str, Any]]:
+# Exact-query hash -> (expiry on the monotonic clock, cache hit), in LRU order.
+# Only touched from the event loop, so no lock is needed.
+local_cache_entries: "OrderedDict[int, tuple]" = OrderedDict()
+
+def local_cache_get(query: str) -> Optional[Dict[str, Any]]:
+    """Return the locally cached hit for this exact query, if still fresh."""
+    key = xxhash.xxh3_64_intdigest(query)
+    entry = local_cache_entries.get(key)
+    if entry is None:
+        return None
+    expires_at, result = entry
+    if expires_at <= time.monotonic():
+        del local_cache_entries[key]
+        return None
+    local_cache_entries.move_to_end(key)
+    return result
+
+def local_cache_put(query: str, result: Dict[str, Any]):
+    """Remember a cache hit for this exact query, evicting the oldest entry when full."""
+    # The Redis entry expires cache_ttl seconds after cached_at; don't outlive it
+    try:
+        redis_ttl_left = datetime.fromisoformat(result["cached_at"]).timestamp() + cache_ttl - time.time()
+    except (TypeError, ValueError):
+        return
+    ttl = min(local_cache_ttl, redis_ttl_left)
+    if ttl <= 0:
+        return
+    key = xxhash.xxh3_64_intdigest(query)
+    local_cache_entries[key] = (time.monotonic() + ttl, result)
+    local_cache_entries.move_to_end(key)
+    if len(local_cache_entries) > local_cache_size:
+        local_cache_entries.popitem(last=False)
+
+async def check_semantic_cache(query: str, query_embedding: np.ndarray, *, is_info: bool) -> Optional[Dict[str, Any]]:
     """Optimized semantic cache check with performance improvements"""
     
     # Fast path: Check if caching is enabled
-    if not PERFORMANCE_CONFIG.get("enable_semantic_cache", True):
+    if not semantic_cache_enabled:
         return None
     
     # Only check cache for information requests
-    if not is_information_request(query):
+    if not is_info:
         debug_log("CACHE_CHECK_SKIP: Not an information request: '%s'", query)
         return None
+    
+    if local_cache_enabled:
+        local_hit = local_cache_get(query)
+        if local_hit is not None:
+            logger.info("CACHE_HIT: local exact match, similarity=%s%%", local_hit["similarity"])
+            return local_hit
         
     if not is_redis_connected or not cache_index:
         debug_log("CACHE_UNAVAILABLE: Redis not connected or cache_index missing")
         return None
         
     try:
-        # Generate real embedding for the query using SentenceTransformers
-        try:
-            embedding_array = tool_embeddings.generate_embedding(query)
-            query_embedding = embedding_array.tolist()
-        except Exception as e:
-            logger.error(f" CRITICAL: Cache embedding generation failed: {e}")
-            raise RuntimeError(f"Cannot generate cache embedding for query: {e}")
-        
         # Search for similar cached queries
         cache_query = VectorQuery(
-            vector=query_embedding,
+            vector=tool_embeddings.embedding_to_bytes(query_embedding),
             vector_field_name="embedding",
-            return_fields=["query", "response", "tools_used", "cached_at"],
+            dtype=vector_datatype,
+            return_fields=["query", "response", "cached_at"],  # the hit path does not need tools_used
             num_results=1
         )
         
@@ -890,22 +1254,24 @@ async def check_semantic_cache(query: str) -> Optional[Dict[str, Any]]:
         if results and len(results) > 0:
             result = results[0]
             similarity = 1 - float(result["vector_distance"])
-            threshold = PERFORMANCE_CONFIG["cache_similarity_threshold"]
+            threshold = cache_similarity_threshold
             
-            logger.info(f"CACHE_SIMILARITY_CHECK: similarity={similarity:.3f} threshold={threshold:.3f} query='{result.get('query', 'N/A')}'")
+            logger.info("CACHE_SIMILARITY_CHECK: similarity=%.3f threshold=%.3f query='%s'", similarity, threshold, result.get('query', 'N/A'))
             
             # Check if similarity meets threshold
             if similarity >= threshold:
-                logger.info(f"CACHE_HIT: {similarity:.0%} similarity with cached query='{result.get('query', 'N/A')}'")
-                return {
+                logger.info("CACHE_HIT: %.0f%% similarity with cached query='%s'", similarity * 100, result.get('query', 'N/A'))
+                cache_hit = {
                     "response": result["response"],
                     "similarity": int(similarity * 100),
                     "cached_at": result["cached_at"],
-                    "original_query": result.get("query", "Previous similar query"),
-                    "tools_used": json.loads(result.get("tools_used", "[]"))
+                    "original_query": result.get("query", "Previous similar query")
                 }
+                if local_cache_enabled:
+                    local_cache_put(query, cache_hit)
+                return cache_hit
             else:
-                logger.info(f"CACHE_MISS: similarity={similarity:.3f} below threshold={threshold:.3f}")
+                logger.info("CACHE_MISS: similarity=%.3f below threshold=%.3f", similarity, threshold)
         
         # No cache hit found
         logger.info("CACHE_MISS: No similar cached queries found")
@@ -916,37 +1282,26 @@ async def check_semantic_cache(query: str) -> Optional[Dict[str, Any]]:
         return None
 
 
+# Information request keywords as whole words, or a trailing question mark
+INFO_REQUEST_RE = re.compile(
+    r"\b(get|search|find|show|list|display|what|where|when|why|how|which|who"
+    r"|tell me|give me|fetch|retrieve|look up)\b|\?\s*$",
+    re.IGNORECASE
+)
+
 def is_information_request(query: str) -> bool:
     """Check if the query is requesting information (cacheable)."""
-    query_lower = query.lower().strip()
-    
-    # Information request keywords
-    info_keywords = [
-        "get", "search", "find", "show", "list", "display",
-        "what", "where", "when", "why", "how", "which", "who",
-        "tell me", "give me", "fetch", "retrieve", "look up"
-    ]
-    
-    # Check if query starts with or contains information request patterns
-    for keyword in info_keywords:
-        if query_lower.startswith(keyword) or f" {keyword} " in f" {query_lower} ":
-            return True
-    
-    # Also check for question patterns
-    if query_lower.endswith("?"):
-        return True
-        
-    return False
+    return INFO_REQUEST_RE.search(query) is not None
 
-async def store_in_cache(query: str, response: str, tools_used: List[str]):
+async def store_in_cache(query: str, query_embedding: np.ndarray, response: str, tools_used: List[str], *, is_info: bool):
     """Optimized cache storage with performance improvements"""
     
     # Fast path: Check if caching is enabled  
-    if not PERFORMANCE_CONFIG.get("enable_semantic_cache", True):
+    if not semantic_cache_enabled:
         return
     
     # Only cache information requests
-    if not is_information_request(query):
+    if not is_info:
         debug_log("CACHE_STORE_SKIP: Not an information request: '%s'", query)
         return
         
@@ -957,33 +1312,28 @@ async def store_in_cache(query: str, response: str, tools_used: List[str]):
         return
         
     try:
-        # Generate real embedding for the query using SentenceTransformers
-        try:
-            embedding_array = tool_embeddings.generate_embedding(query)
-            query_embedding = embedding_array.tolist()
-        except Exception as e:
-            logger.error(f" CRITICAL: Cache storage embedding generation failed: {e}")
-            raise RuntimeError(f"Cannot generate embedding for caching: {e}")
-        
         # Store using direct Redis operations but compatible with RedisVL search
-        cache_key = f"supportAssistant:cache:{abs(hash(query)) % 10000}"
+        # 64-bit content hash: stable across restarts, no bucket collisions
+        cache_key = f"supportAssistant:cache:{xxhash.xxh3_64_hexdigest(query)}"
         
         # Convert embedding to bytes for Redis storage
-        embedding_bytes = np.array(query_embedding, dtype=np.float32).tobytes()
+        embedding_bytes = tool_embeddings.embedding_to_bytes(query_embedding)
         
         cache_data = {
             "query": query,
             "response": response,
-            "tools_used": json.dumps(tools_used),
-            "cached_at": datetime.now().isoformat(),
+            "tools_used": orjson.dumps(tools_used),
+            "cached_at": iso_now(),
             "embedding": embedding_bytes
         }
         
-        # Store in Redis with TTL (direct operation for reliability)
-        await redis_client.hset(cache_key, mapping=cache_data)
-        await redis_client.expire(cache_key, PERFORMANCE_CONFIG["cache_ttl"])
+        # Store in Redis with TTL in a single round trip
+        async with redis_client.pipeline(transaction=False) as pipe:
+            pipe.hset(cache_key, mapping=cache_data)
+            pipe.expire(cache_key, cache_ttl)
+            await pipe.execute()
         
-        logger.info(f"✅ CACHE_STORED: query='{query}' key={cache_key}")
+        logger.info("✅ CACHE_STORED: query='%s' key=%s", query, cache_key)
         
     except Exception as e:
         logger.error(f"Cache storage error: {e}")
@@ -1018,10 +1368,11 @@ def format_tool_selection_response(selected_tools: List[Dict[str, Any]], method:
     
     return summary
 
+WRITE_OPERATION_RE = re.compile(r"\b(create|send|update|add|delete)\b", re.IGNORECASE)
+
 def is_write_operation(query: str) -> bool:
     """Check if query involves write operations."""
-    write_keywords = ["create", "send", "update", "add", "delete", "draft and send"]
-    return any(keyword in query.lower() for keyword in write_keywords)
+    return WRITE_OPERATION_RE.search(query) is not None
 
 async def process_baseline_query(query: str) -> ChatResponse:
     """
@@ -1041,19 +1392,16 @@ async def process_baseline_query(query: str) -> ChatResponse:
         raise HTTPException(status_code=503, detail="LLM service not available")
     
     start_time = time.time()
-    logger.info(f"BASELINE_QUERY_START: query_length={len(query)} approach=all_tools_to_llm")
+    logger.info("BASELINE_QUERY_START: query_length=%d approach=all_tools_to_llm", len(query))
     
-    # Get all tools with full realistic definitions
-    all_tools = []
-    for server_name, server_tools in TOOLS_CONFIG.items():
-        for tool in server_tools:
-            all_tools.append({**tool, "server": server_name})
+    # All tools with full realistic definitions (built once at startup)
+    all_tools = all_tools_cache
     
-    logger.info(f"BASELINE_TOOLS_LOADED: total_tools={len(all_tools)} servers={len(TOOLS_CONFIG)}")
+    logger.info("BASELINE_TOOLS_LOADED: total_tools=%d servers=%d", len(all_tools), len(TOOLS_CONFIG))
     
     try:
         # Call LLM with ALL tools - this is the baseline (expensive)
-        logger.info(f"BASELINE_LLM_CALL: sending_all_tools={len(all_tools)} to LLM")
+        logger.info("BASELINE_LLM_CALL: sending_all_tools=%d to LLM", len(all_tools))
         llm_result = await llm_service.select_relevant_tools(query, all_tools)
         
         # Show actual LLM tool selection results instead of mock business response
@@ -1062,12 +1410,12 @@ async def process_baseline_query(query: str) -> ChatResponse:
         end_time = time.time()
         actual_latency = round(end_time - start_time, 3)
         
-        logger.info(f"BASELINE_COMPLETE: latency={actual_latency}s tokens={llm_result['tokens']} cost=${llm_result['cost']:.4f} tools_sent={len(all_tools)} tools_selected={len(llm_result['tools'])}")
+        logger.info("BASELINE_COMPLETE: latency=%ss tokens=%d cost=$%.4f tools_sent=%d tools_selected=%d", actual_latency, llm_result['tokens'], llm_result['cost'], len(all_tools), len(llm_result['tools']))
         
         # Professional workflow analysis
-        logger.info(f"WORKFLOW_ANALYSIS: phase=tool_selection method=baseline status=complete")
-        logger.info(f"NEXT_PHASE: mcp_tool_execution tools_to_execute={len(llm_result['tools'])} estimated_time={len(llm_result['tools'])*2.5:.1f}s")
-        logger.info(f"REDIS_VALUE_PROP: current_bottleneck=llm_reasoning scales_poorly=yes solution=vector_prefiltering")
+        logger.info("WORKFLOW_ANALYSIS: phase=tool_selection method=baseline status=complete")
+        logger.info("NEXT_PHASE: mcp_tool_execution tools_to_execute=%d estimated_time=%.1fs", len(llm_result['tools']), len(llm_result['tools']) * 2.5)
+        logger.info("REDIS_VALUE_PROP: current_bottleneck=llm_reasoning scales_poorly=yes solution=vector_prefiltering")
         
         return ChatResponse(
             response=response_text,
@@ -1103,26 +1451,45 @@ async def process_optimized_query(query: str) -> ChatResponse:
         raise HTTPException(status_code=503, detail="LLM service not available")
     
     start_time = time.time()
-    logger.info(f"OPTIMIZED_QUERY_START: query_length={len(query)} approach=vector_search_plus_cache")
+    logger.info("OPTIMIZED_QUERY_START: query_length=%d approach=vector_search_plus_cache", len(query))
     
-    # Parallel cache check + vector search preparation for optimal latency
+    # Embed the query once; cache check, vector search and cache store all reuse it
+    embedding_start = time.time()
+    try:
+        # Model inference is CPU-bound; keep it off the event loop
+        query_embedding = await asyncio.to_thread(tool_embeddings.generate_embedding, query)
+    except Exception as e:
+        logger.error(f" CRITICAL: Query embedding generation failed: {e}")
+        raise HTTPException(status_code=500, detail=f"Cannot generate embedding for query: {e}")
+    perf_log("EMBEDDING_GENERATED: method=SentenceTransformer time_ms=%d dimensions=%d", int((time.time() - embedding_start) * 1000), len(query_embedding))
+    
+    # Classify the query once for the cache check, cache store and status
+    is_info = is_information_request(query)
+    is_write = is_write_operation(query)
+    
+    # Parallel cache check + vector search for optimal latency
     cache_start = time.time()
-    total_available = sum(len(tools) for tools in TOOLS_CONFIG.values())
+    total_available = len(all_tools_cache)
     
     # Start both cache check and vector search in parallel (cache is usually faster)
-    cache_task = asyncio.create_task(check_semantic_cache(query))
-    # Pre-calculate for potential vector search
+    cache_task = asyncio.create_task(check_semantic_cache(query, query_embedding, is_info=is_info))
+    vector_start = time.time()
+    logger.info("VECTOR_FILTERING_START: total_available_tools=%d", total_available)
+    vector_task = asyncio.create_task(vector_search_tools(query, query_embedding))
     
     cached_result = await cache_task
     cache_check_time = int((time.time() - cache_start) * 1000)
-    logger.info(f"CACHE_CHECK_COMPLETE: time_ms={cache_check_time} result={'HIT' if cached_result else 'MISS'}")
+    logger.info("CACHE_CHECK_COMPLETE: time_ms=%d result=%s", cache_check_time, 'HIT' if cached_result else 'MISS')
     
     if cached_result:
-        # Cache hit - return immediately with real timing
+        # Cache hit - the vector search result is not needed
+        vector_task.cancel()
+        
+        # Return immediately with real timing
         cache_end_time = time.time()
         cache_latency = round(cache_end_time - start_time, 3)
         
-        logger.info(f"CACHE_HIT_RETURN: latency={cache_latency}s similarity={cached_result.get('similarity')}% tokens_saved=significant cost_saved=significant")
+        logger.info("CACHE_HIT_RETURN: latency=%ss similarity=%s%% tokens_saved=significant cost_saved=significant", cache_latency, cached_result.get('similarity'))
         
         return ChatResponse(
             response=cached_result["response"],
@@ -1136,26 +1503,20 @@ async def process_optimized_query(query: str) -> ChatResponse:
             original_query=cached_result.get("original_query")
         )
     
-    # Cache miss - now do vector search
-    vector_start = time.time()
-    logger.info(f"VECTOR_FILTERING_START: total_available_tools={total_available}")
-    
-    vector_filtered_tools = await vector_search_tools(query)
+    # Cache miss - the vector search has been running since the cache check started
+    vector_filtered_tools = await vector_task
     vector_end_time = time.time()
     vector_time = int((vector_end_time - vector_start) * 1000)
     
-    logger.info(f"VECTOR_FILTERING_COMPLETE: tools_reduced_from={total_available}_to={len(vector_filtered_tools)} reduction_ratio={len(vector_filtered_tools)/total_available:.1%} time_ms={vector_time}")
+    logger.info("VECTOR_FILTERING_COMPLETE: tools_reduced_from=%d_to=%d reduction_ratio=%.1f%% time_ms=%d", total_available, len(vector_filtered_tools), len(vector_filtered_tools) / total_available * 100, vector_time)
     
-    # Convert to format needed for LLM (optimized lookup)
-    filtered_for_llm = []
-    # Use precomputed global tool lookup cache - O(1) lookup
-    for tool in vector_filtered_tools:
-        if tool["name"] in tool_lookup_cache:
-            filtered_for_llm.append(tool_lookup_cache[tool["name"]])
+    # Vector results already carry name/server/type and format_tools_for_llm pulls
+    # full definitions from tool_lookup_cache, so they go to the LLM as-is
+    filtered_for_llm = vector_filtered_tools
     
     try:
         # Call LLM with ONLY the pre-filtered tools (much fewer than baseline)
-        logger.info(f"OPTIMIZED_LLM_CALL: sending_filtered_tools={len(filtered_for_llm)} reduction_from={total_available}")
+        logger.info("OPTIMIZED_LLM_CALL: sending_filtered_tools=%d reduction_from=%d", len(filtered_for_llm), total_available)
         llm_result = await llm_service.select_relevant_tools(query, filtered_for_llm)
         
         # Show actual LLM tool selection results instead of mock business response
@@ -1164,21 +1525,25 @@ async def process_optimized_query(query: str) -> ChatResponse:
         end_time = time.time()
         actual_latency = round(end_time - start_time, 3)
         
+        selected_names = [tool["name"] for tool in llm_result["tools"]]
+        
         # Store in cache if it's a read operation (for next time)
-        will_cache = not is_write_operation(query)
+        will_cache = not is_write
         if will_cache:
-            await store_in_cache(query, response_text, [tool["name"] for tool in llm_result["tools"]])
+            await store_in_cache(query, query_embedding, response_text, selected_names, is_info=is_info)
         
         # Determine cache status
-        cache_status = "BYPASS" if is_write_operation(query) else "MISS"
+        cache_status = "BYPASS" if is_write else "MISS"
         
-        logger.info(f"OPTIMIZED_COMPLETE: latency={actual_latency}s tokens={llm_result['tokens']} cost=${llm_result['cost']:.4f} tools_sent={len(filtered_for_llm)} tools_selected={len(llm_result['tools'])} cache_status={cache_status} will_cache={will_cache}")
-        
-        # Professional workflow analysis  
-        efficiency_gain = (1 - (len(filtered_for_llm) / total_available)) * 100 if total_available > 0 else 0
-        logger.info(f"WORKFLOW_ANALYSIS: phase=tool_selection method=redis_optimized status=complete efficiency_gain={efficiency_gain:.1f}%")
-        logger.info(f"NEXT_PHASE: mcp_tool_execution tools_to_execute={len(llm_result['tools'])} estimated_time={len(llm_result['tools'])*2.5:.1f}s")
-        logger.info(f"REDIS_IMPACT: prefiltering_reduced_context_by={efficiency_gain:.1f}% reasoning_time_saved={actual_latency:.1f}s")
+        if logger.isEnabledFor(logging.INFO):
+            tools_selected = len(selected_names)
+            logger.info("OPTIMIZED_COMPLETE: latency=%ss tokens=%d cost=$%.4f tools_sent=%d tools_selected=%d cache_status=%s will_cache=%s", actual_latency, llm_result['tokens'], llm_result['cost'], len(filtered_for_llm), tools_selected, cache_status, will_cache)
+            
+            # Professional workflow analysis
+            efficiency_gain = (1 - (len(filtered_for_llm) / total_available)) * 100 if total_available > 0 else 0
+            logger.info("WORKFLOW_ANALYSIS: phase=tool_selection method=redis_optimized status=complete efficiency_gain=%.1f%%", efficiency_gain)
+            logger.info("NEXT_PHASE: mcp_tool_execution tools_to_execute=%d estimated_time=%.1fs", tools_selected, tools_selected * 2.5)
+            logger.info("REDIS_IMPACT: prefiltering_reduced_context_by=%.1f%% reasoning_time_saved=%.1fs", efficiency_gain, actual_latency)
         
         return ChatResponse(
             response=response_text,
@@ -1188,7 +1553,7 @@ async def process_optimized_query(query: str) -> ChatResponse:
             tools_count=len(vector_filtered_tools),  # Actual vector search results count
             cache_status=cache_status,
             vector_search_time=vector_time,
-            tools_used=[tool["name"] for tool in llm_result["tools"]],
+            tools_used=selected_names,
             filtered_tools=[tool["name"] for tool in vector_filtered_tools]
         )
         
@@ -1212,13 +1577,16 @@ async def startup_event():
     logger.info("Initializing Redis MCP Latency Reduction Demo...")
     
     # Initialize real embedding service (like redis-movie-search) - REQUIRED
-    global tool_embeddings
+    global tool_embeddings, vector_dim
     try:
         logger.info("Initializing SentenceTransformers embedding service...")
         tool_embeddings = ToolEmbeddings()
         logger.info(f"SentenceTransformers ready: {tool_embeddings.dimension}-dimensional embeddings")
         # Update config with actual dimension
-        PERFORMANCE_CONFIG["vector_dim"] = tool_embeddings.dimension
+        PERFORMANCE_CONFIG["vector_dim"] = vector_dim = tool_embeddings.dimension
+        warmup_start = time.time()
+        tool_embeddings.warmup()
+        logger.info(f"Embedding model warmed up in {int((time.time() - warmup_start) * 1000)}ms")
         logger.info("Real-time embeddings enabled")
     except Exception as e:
         logger.error(f"CRITICAL: Embedding service initialization failed: {e}")
@@ -1227,11 +1595,20 @@ async def startup_event():
         raise RuntimeError("Cannot start demo without real embedding service")
     
     # Initialize global tool lookup cache for O(1) performance
-    global tool_lookup_cache
+    # Embedding text is deterministic per tool, so build it once alongside
+    global tool_lookup_cache, embedding_text_cache, all_tools_cache, all_tools_json, all_tools_json_gzip
     tool_lookup_cache = {}
+    embedding_text_cache = {}
+    all_tools_cache = []
     for server_name, server_tools in TOOLS_CONFIG.items():
         for tool in server_tools:
-            tool_lookup_cache[tool["name"]] = {**tool, "server": server_name}
+            full_tool = {**tool, "server": server_name}
+            tool_lookup_cache[tool["name"]] = full_tool
+            all_tools_cache.append(full_tool)
+            embedding_text_cache[tool["name"]] = generate_enhanced_embedding_text(tool, server_name)
+    # Tool definitions are static, so the tool list response is serialized only once
+    all_tools_json = orjson.dumps(all_tools_cache)
+    all_tools_json_gzip = gzip.compress(all_tools_json, compresslevel=9)
     logger.info(f"Tool lookup cache initialized with {len(tool_lookup_cache)} tools")
     
     # Initialize Redis
@@ -1253,6 +1630,18 @@ async def startup_event():
     
     logger.info("Demo initialization complete")
 
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Release the shared OpenAI HTTP client and Redis connection pools on application shutdown."""
+    if llm_service and llm_service.client:
+        # Closes the httpx.AsyncClient passed in at initialize()
+        await llm_service.client.close()
+    if redis_client:
+        await redis_client.connection_pool.disconnect()
+    if sync_redis_client:
+        sync_redis_client.connection_pool.disconnect()
+    logger.info("Redis connection pools closed")
+
 @app.get("/")
 async def serve_index():
     """Serve the main demo page."""
@@ -1271,7 +1660,7 @@ async def health_check() -> HealthResponse:
         redis=is_redis_connected,
         sentence_transformers=tool_embeddings is not None,
         openai=llm_service is not None and llm_service.client is not None,
-        timestamp=datetime.now().isoformat()
+        timestamp=iso_now()
     )
 
 @app.post("/api/query")
@@ -1294,39 +1683,127 @@ async def process_query(request: ChatRequest) -> ChatResponse:
         logger.error(f"Query processing error: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
+def accepts_gzip(accept_encoding: str) -> bool:
+    """
+    Check whether an Accept-Encoding header allows a gzip response.
+    
+    An explicit gzip entry wins over "*"; either is refused with q=0.
+    
+    Args:
+        accept_encoding: Raw Accept-Encoding header value
+        
+    Returns:
+        True if gzip is acceptable
+    """
+    wildcard_ok = False
+    for entry in accept_encoding.split(","):
+        coding, _, params = entry.partition(";")
+        coding = coding.strip().lower()
+        if coding not in ("gzip", "*"):
+            continue
+        quality = 1.0
+        for param in params.split(";"):
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        if coding == "gzip":
+            return quality > 0
+        wildcard_ok = quality > 0
+    return wildcard_ok
+
 @app.get("/api/tools")
-async def get_all_tools():
+async def get_all_tools(request: Request):
     """Get list of all available tools."""
-    all_tools = []
-    for server_name, tools in TOOLS_CONFIG.items():
-        for tool in tools:
-            all_tools.append({
-                **tool,
-                "server": server_name
-            })
-    return all_tools
+    # Tool descriptions are long prose and compress well; both bodies are prebuilt
+    if accepts_gzip(request.headers.get("accept-encoding", "")):
+        return Response(
+            content=all_tools_json_gzip,
+            media_type="application/json",
+            headers={"Content-Encoding": "gzip", "Vary": "Accept-Encoding"}
+        )
+    return Response(content=all_tools_json, media_type="application/json", headers={"Vary": "Accept-Encoding"})
+
+# Keys per UNLINK command: bounds how long any single command holds the server
+KEY_DELETE_CHUNK_SIZE = 128
+# Keys fetched from the cache index per round, UNLINKed in chunks over one pipeline
+PURGE_PAGE_SIZE = KEY_DELETE_CHUNK_SIZE * 8
+# Pause between purge rounds so foreground queries interleave with a large purge
+purge_chunk_sleep = PERFORMANCE_CONFIG.get("purge_chunk_sleep_ms", 10) / 1000
+
+async def purge_cache_keys() -> int:
+    """
+    Remove every semantic cache entry without scanning the keyspace.
+    
+    The semantic cache index already tracks exactly the live cache keys
+    (expired entries drop out on their own), so each round asks it for up
+    to PURGE_PAGE_SIZE keys and UNLINKs them in KEY_DELETE_CHUNK_SIZE chunks
+    over a single reused pipeline (values are freed on a Redis background
+    thread). Cost follows the cache size, not the size of the whole database.
+    Rounds are paced by purge_chunk_sleep so a large purge does not crowd
+    out live query traffic. The loop runs until the index reports no
+    results left to visit.
+    
+    Returns:
+        Number of keys removed
+    """
+    if cache_index is None:
+        return 0
+    
+    removed = 0
+    # Entries the index still lists but whose keys are already gone stay at the
+    # front of the result set; skip past them instead of stopping
+    offset = 0
+    cache_search = redis_client.ft(cache_index.name)
+    page_query = Query("*").no_content()
+    async with redis_client.pipeline(transaction=False) as pipe:
+        while True:
+            result = await cache_search.search(page_query.paging(offset, PURGE_PAGE_SIZE))
+            keys = [doc.id for doc in result.docs]
+            if result.total <= offset or not keys:
+                return removed
+            for start in range(0, len(keys), KEY_DELETE_CHUNK_SIZE):
+                pipe.unlink(*keys[start:start + KEY_DELETE_CHUNK_SIZE])
+            # execute() resets the pipeline, so the same instance serves every page
+            unlinked = sum(await pipe.execute())
+            removed += unlinked
+            offset += len(keys) - unlinked
+            if purge_chunk_sleep:
+                await asyncio.sleep(purge_chunk_sleep)
+
+async def release_freed_memory():
+    """
+    Ask Redis to hand allocator pages freed by a bulk delete back to the OS.
+    
+    Only jemalloc builds support MEMORY PURGE, and managed services may block
+    it, so failures are logged and ignored. Self-managed instances should
+    also run with `activedefrag yes` and `jemalloc-bg-thread yes`.
+    """
+    try:
+        await redis_client.execute_command("MEMORY", "PURGE")
+    except Exception as e:
+        debug_log("MEMORY PURGE unavailable: %s", e)
 
 @app.delete("/api/cache")
 async def clear_cache():
     """Clear the semantic cache."""
-    if not is_redis_connected:
+    if not is_redis_connected or cache_index is None:
         return {"cleared_items": 0, "message": "Cache not available - Redis not connected"}
     
     try:
         # Delete only our support assistant cache keys
-        cache_keys = []
-        async for key in redis_client.scan_iter(match="supportAssistant:cache:*"):
-            cache_keys.append(key)
+        cleared = await purge_cache_keys()
+        local_cache_entries.clear()
+        if cleared:
+            await release_freed_memory()
         
-        if cache_keys:
-            await redis_client.delete(*cache_keys)
-        
-        
-        logger.info(f"Cache cleared: {len(cache_keys)} items removed")
+        logger.info(f"Cache cleared: {cleared} items removed")
         
         return {
-            "cleared_items": len(cache_keys),
-            "message": f"Cache cleared! {len(cache_keys)} items removed."
+            "cleared_items": cleared,
+            "message": f"Cache cleared! {cleared} items removed."
         }
         
     except Exception as e:
@@ -1338,11 +1815,11 @@ async def get_performance_stats():
     """Get comprehensive performance statistics and cache metrics"""
     stats = {
         "config": {
-            "semantic_cache_enabled": PERFORMANCE_CONFIG.get("enable_semantic_cache", True),
-            "cache_similarity_threshold": PERFORMANCE_CONFIG.get("cache_similarity_threshold", 0.65),
+            "semantic_cache_enabled": semantic_cache_enabled,
+            "cache_similarity_threshold": cache_similarity_threshold,
             "log_level": PERFORMANCE_CONFIG.get("log_level", "INFO"),
             "timing_logs_enabled": enable_timing_logs,
-            "embedding_cache_size": PERFORMANCE_CONFIG.get("embedding_cache_size", 1000)
+            "embedding_cache_size": embedding_cache_size
         },
         "caches": {
             "tool_lookup_cache_size": len(tool_lookup_cache),
@@ -1357,8 +1834,9 @@ async def get_performance_stats():
     # Add Redis cache stats if available
     if is_redis_connected:
         try:
-            cache_keys = await redis_client.keys("supportAssistant:cache:*")
-            stats["caches"]["redis_cache_items"] = len(cache_keys)
+            # FT.INFO doc count of the cache index - O(1), unlike KEYS over the keyspace
+            cache_info = await asyncio.to_thread(cache_index.info)
+            stats["caches"]["redis_cache_items"] = int(cache_info["num_docs"])
         except:
             stats["caches"]["redis_cache_items"] = "unavailable"
     
@@ -1378,59 +1856,242 @@ async def debug_embeddings():
     ]
     
     for server_name, tool_name in key_tools:
-        if server_name in TOOLS_CONFIG:
-            for tool in TOOLS_CONFIG[server_name]:
-                if tool["name"] == tool_name:
-                    embedding_text = generate_enhanced_embedding_text(tool, server_name)
-                    debug_results.append({
-                        "tool_name": tool_name,
-                        "server": server_name,
-                        "embedding_text": embedding_text[:500] + "..." if len(embedding_text) > 500 else embedding_text,
-                        "text_length": len(embedding_text)
-                    })
-                    break
+        embedding_text = embedding_text_cache.get(tool_name)
+        if embedding_text is not None:
+            debug_results.append({
+                "tool_name": tool_name,
+                "server": server_name,
+                "embedding_text": embedding_text[:500] + "..." if len(embedding_text) > 500 else embedding_text,
+                "text_length": len(embedding_text)
+            })
     
     return {"debug_embeddings": debug_results}
 
+async def drop_index_with_documents(index_name: str):
+    """
+    Drop a search index and all of its documents with one FT.DROPINDEX ... DD.
+    
+    Args:
+        index_name: Name of the index to drop
+    """
+    await redis_client.ft(index_name).dropindex(delete_documents=True)
+
+# Seconds a retired tool index epoch is kept after the alias moves on, so
+# other workers finish any in-flight work against it before it is dropped
+TOOL_INDEX_RETIRE_GRACE = 60
+# Strong references to fire-and-forget tasks so they are not garbage collected
+background_tasks = set()
+
+async def retire_tool_index(index_name: str):
+    """
+    Drop a replaced tool index epoch once its grace period has passed.
+    
+    Args:
+        index_name: Name of the retired index
+    """
+    await asyncio.sleep(TOOL_INDEX_RETIRE_GRACE)
+    try:
+        await drop_index_with_documents(index_name)
+        logger.info(f"Retired tool index '{index_name}' dropped")
+        await release_freed_memory()
+    except Exception as e:
+        # Startup cleanup (drop_retired_tool_indexes) catches it next time
+        logger.warning(f"Could not drop retired tool index '{index_name}': {e}")
+
+def tool_text_digests() -> Dict[str, bytes]:
+    """Digest of every tool's embedding text, as bytes to compare with raw HGET replies."""
+    return {name: xxhash.xxh3_64_hexdigest(text).encode() for name, text in embedding_text_cache.items()}
+
+async def changed_tool_names(index: SearchIndex, current: Dict[str, bytes]) -> List[str]:
+    """
+    Find the tools whose stored text digest in an index differs from the current one.
+    
+    Args:
+        index: Tool index epoch to compare against
+        current: Current digests from tool_text_digests()
+        
+    Returns:
+        Names of tools that changed or are missing from the index
+    """
+    names = list(current)
+    async with redis_client.pipeline(transaction=False) as pipe:
+        for name in names:
+            pipe.hget(f"{index.prefix}{name}", "text_hash")
+        stored = await pipe.execute()
+    return [name for name, digest in zip(names, stored) if digest != current[name]]
+
+async def invalidate_cached_responses(changed_tools) -> int:
+    """
+    Remove semantic cache entries answered with tools whose definition changed.
+    
+    Entries that used a tool no longer in the tool set are removed as well.
+    Other workers' in-process caches are not reached; their entries expire
+    within local_cache_ttl.
+    
+    Args:
+        changed_tools: Names of tools whose definition changed
+        
+    Returns:
+        Number of cache entries removed
+    """
+    if not changed_tools or cache_index is None:
+        return 0
+    
+    changed_tools = set(changed_tools)
+    stale_keys = []
+    offset = 0
+    cache_search = redis_client.ft(cache_index.name)
+    page_query = Query("*").return_field("tools_used")
+    while True:
+        result = await cache_search.search(page_query.paging(offset, PURGE_PAGE_SIZE))
+        if not result.docs:
+            break
+        for doc in result.docs:
+            try:
+                tools_used = orjson.loads(doc.tools_used)
+            except (AttributeError, orjson.JSONDecodeError):
+                continue
+            if any(name in changed_tools or name not in tool_lookup_cache for name in tools_used):
+                stale_keys.append(doc.id)
+        offset += len(result.docs)
+        if offset >= result.total:
+            break
+    
+    removed = 0
+    if stale_keys:
+        async with redis_client.pipeline(transaction=False) as pipe:
+            for start in range(0, len(stale_keys), KEY_DELETE_CHUNK_SIZE):
+                pipe.unlink(*stale_keys[start:start + KEY_DELETE_CHUNK_SIZE])
+            removed = sum(await pipe.execute())
+    local_cache_entries.clear()
+    return removed
+
+async def rebuild_tool_index() -> int:
+    """
+    Rebuild the tool index online under the next epoch.
+    
+    The new index is created and populated alongside the live one; the alias
+    and search_index switch over only once it holds every tool. Searches go
+    through the alias, so no worker ever queries a half-built index, and the
+    old epoch is dropped only after TOOL_INDEX_RETIRE_GRACE seconds.
+    Cached responses that used a tool whose definition changed are removed.
+    
+    Returns:
+        The new live epoch
+    """
+    old_index = search_index
+    new_epoch = tool_index_epoch + 1
+    new_index = SearchIndex.from_dict(build_tool_schema(new_epoch))
+    new_index.set_client(sync_redis_client)
+    try:
+        # Leftover from an interrupted rebuild
+        await drop_index_with_documents(new_index.name)
+    except Exception:
+        pass
+    await asyncio.to_thread(new_index.create)
+    await index_tools_with_embeddings(new_index)
+    
+    indexed = int((await asyncio.to_thread(new_index.info))["num_docs"])
+    if indexed < len(all_tools_cache):
+        await drop_index_with_documents(new_index.name)
+        raise RuntimeError(f"Rebuilt tool index incomplete ({indexed}/{len(all_tools_cache)} tools) - keeping epoch {tool_index_epoch}")
+    
+    changed = await changed_tool_names(old_index, tool_text_digests())
+    
+    await asyncio.to_thread(sync_redis_client.ft(new_index.name).aliasupdate, TOOL_INDEX_ALIAS)
+    bind_tool_indexes(new_epoch)
+    logger.info(f"Tool index switched to epoch {new_epoch}")
+    
+    invalidated = await invalidate_cached_responses(changed)
+    if invalidated:
+        logger.info(f"Removed {invalidated} cached responses that used changed tools")
+    
+    task = asyncio.create_task(retire_tool_index(old_index.name))
+    background_tasks.add(task)
+    task.add_done_callback(background_tasks.discard)
+    return new_epoch
+
+# Above this share of changed tools, a full epoch rebuild beats in-place updates
+REINDEX_FULL_REBUILD_RATIO = 0.5
+
+async def refresh_changed_tools() -> Optional[int]:
+    """
+    Re-embed only the tools whose embedding text changed since they were indexed.
+    
+    Each tool hash stores a digest of its embedding text; tools whose stored
+    digest differs (or is missing) are re-embedded in one batch and upserted
+    into the live index over one pipeline, and cached responses that used
+    them are removed.
+    
+    Returns:
+        Number of tools updated in place, or None when a full rebuild is
+        needed (tool count changed, or too many tools changed)
+    """
+    index = search_index
+    names = list(embedding_text_cache)
+    
+    indexed = int((await asyncio.to_thread(index.info))["num_docs"])
+    if indexed != len(names):
+        return None
+    
+    current = tool_text_digests()
+    changed = await changed_tool_names(index, current)
+    if len(changed) > len(names) * REINDEX_FULL_REBUILD_RATIO:
+        return None
+    if not changed:
+        return 0
+    
+    embeddings = await asyncio.to_thread(
+        tool_embeddings.generate_embeddings_batch, [embedding_text_cache[name] for name in changed]
+    )
+    async with redis_client.pipeline(transaction=False) as pipe:
+        for name, embedding in zip(changed, embeddings):
+            tool = tool_lookup_cache[name]
+            pipe.hset(f"{index.prefix}{name}", mapping={
+                "name": name,
+                "description": tool["description"],
+                "server": tool["server"],
+                "type": tool["type"],
+                "embedding": tool_embeddings.embedding_to_bytes(embedding),
+                "text_hash": current[name]
+            })
+        await pipe.execute()
+    
+    invalidated = await invalidate_cached_responses(changed)
+    if invalidated:
+        logger.info(f"Removed {invalidated} cached responses that used changed tools")
+    return len(changed)
+
 @app.post("/api/debug/reindex")
-async def force_reindex():
-    """Force regeneration of tool embeddings with updated text."""
+async def force_reindex(full: bool = False):
+    """
+    Force regeneration of tool embeddings with updated text.
+    
+    Args:
+        full: Always rebuild every embedding under a new index epoch, e.g. after
+            an embedding model or vector datatype change that leaves the text
+            digests unchanged
+    """
     if not is_redis_connected or not tool_embeddings:
         return {"error": "Redis or embeddings not available"}
     
     try:
         logger.info("FORCE REINDEX: Regenerating all tool embeddings...")
         
-        # Clear existing tool index more thoroughly
-        try:
-            # Drop the specific indexes first
-            try:
-                search_index.delete(drop=True)
-                logger.info("Search index dropped")
-            except Exception as e:
-                logger.warning(f"Search index drop warning: {e}")
-                
-            try:
-                cache_index.delete(drop=True)
-                logger.info("Cache index dropped")
-            except Exception as e:
-                logger.warning(f"Cache index drop warning: {e}")
-                
-            # Clear only support assistant cache keys (not entire database)
-            sync_keys = [key.decode() for key in sync_redis_client.keys("supportAssistant:cache:*")]
-            if sync_keys:
-                sync_redis_client.delete(*sync_keys)
-                logger.info(f"Cleared {len(sync_keys)} support assistant cache keys")
-            else:
-                logger.info("No support assistant cache keys to clear")
-            
-        except Exception as e:
-            logger.warning(f"Redis clear warning: {e}")
+        # Another worker may have moved the alias since this one last looked
+        await sync_live_tool_index()
         
-        # Recreate indexes with fresh data
-        await setup_redisvl_indexes()
+        # Cheap path first: re-embed just the tools whose text changed, in place
+        updated = None if full else await refresh_changed_tools()
+        if updated is not None:
+            logger.info(f"Incremental reindex: {updated}/{len(embedding_text_cache)} tools re-embedded")
+            return {"message": f"{updated} changed tool embeddings regenerated", "status": "success", "index_epoch": tool_index_epoch, "updated_tools": updated}
+        
+        # Online rebuild: searches keep using the live index until the new epoch is
+        # ready. Only cached responses that used changed tools are dropped.
+        epoch = await rebuild_tool_index()
         
-        return {"message": "Tool embeddings regenerated successfully", "status": "success"}
+        return {"message": "Tool embeddings regenerated successfully", "status": "success", "index_epoch": epoch}
         
     except Exception as e:
         logger.error(f"Reindex error: {e}")
@@ -1441,5 +2102,10 @@ if __name__ == "__main__":
         "app:app",
         host=DEMO_CONFIG["host"],
         port=DEMO_CONFIG["port"],
-        reload=DEMO_CONFIG["debug"]
+        # Auto-reload runs a file-watching supervisor and ignores workers, so it is opt-in
+        reload=DEMO_CONFIG.get("reload", False),
+        workers=DEMO_CONFIG.get("workers", 1),
+        # uvloop/httptools come with uvicorn[standard]; pinned explicitly except on Windows
+        loop="auto" if os.name == "nt" else "uvloop",
+        http="httptools"
     )
\ No newline at end of file
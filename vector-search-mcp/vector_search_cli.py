@@ -16,6 +16,9 @@ from config import REDIS_CONFIG, MCP_CONFIG, OPENAI_CONFIG, get_mcp_path
 from embedding_tool import semantic_movie_search, get_movie_embeddings
 from shared.mcp_utils import validate_environment, initialize_mcp_server
 
+SENTENCE_END = (".", "!", "?", "\n")
+EXIT_COMMANDS = frozenset({"exit", "quit", "q"})
+
 MOVIE_SEARCH_AGENT_INSTRUCTIONS = "Find me the top 2 movies with the given vector. The index_name is movies_vector, the vector_field is plot_embedding. On each movie return the fields title and plot. Include similarity scores."
 
 ## TODO: Add embedding creation to MCP server. Embeddings are too token rich for LLMs -> Hitting Rate Limits. Process on MCP server instead of client side
@@ -56,8 +59,12 @@ async def print_streamed_response(result):
     print(" AI: ", end="")
     async for event in result.stream_events():
         if event.type == "raw_response_event" and isinstance(event.data, ResponseTextDeltaEvent):
-            print(event.data.delta, end="", flush=True)
-    print("\n")
+            delta = event.data.delta
+            sys.stdout.write(delta)
+            # flush on sentence boundaries instead of every token
+            if delta.endswith(SENTENCE_END):
+                sys.stdout.flush()
+    print("\n", flush=True)
 
 
 def print_welcome_message():
@@ -76,13 +83,13 @@ async def run_chat_loop(agent):
     
     while True:
         try:
-            user_input = input(" You: ")
+            user_input = input(" You: ").strip()
             
-            if user_input.lower().strip() in ["exit", "quit", "q"]:
-                break
-                
-            if not user_input.strip():
+            if not user_input:
                 continue
+                
+            if user_input.lower() in EXIT_COMMANDS:
+                break
             
             result = await handle_user_query(agent, user_input)
             await print_streamed_response(result)